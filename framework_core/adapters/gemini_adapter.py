@@ -1,6 +1,6 @@
 import os
 import json
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 import google.generativeai as genai
 from google.ai import generativelanguage as glm # For schema types
 
@@ -161,12 +161,18 @@ class GeminiAdapter(LLMAdapterInterface):
                 history.append(glm.Content(role=gemini_role, parts=[glm.Part(text=content)]))
         return history
     
-    def send_message_sequence(
+    def _prepare_chat_turn(
         self, 
         messages: List[Message], 
         active_persona_id: Optional[str] = None
-    ) -> LLMResponse:
+    ) -> Union[LLMResponse, Tuple[Any, Any]]:
+        """
+        Start a chat session for the messages and pick the content to send.
         
+        Returns:
+            A (chat_session, content_to_send) tuple, or an LLMResponse if
+            there is nothing to send
+        """
         # Dynamically construct system instruction including persona
         dynamic_system_instruction = self._get_dynamic_system_instruction(active_persona_id)
 
@@ -264,35 +270,62 @@ class GeminiAdapter(LLMAdapterInterface):
         
         current_generative_model = genai.GenerativeModel(**current_model_config)
         chat_session = current_generative_model.start_chat(history=history_for_chat_start)
+        
+        # Make sure content is never empty to avoid Gemini API errors
+        if isinstance(content_to_send, str) and not content_to_send.strip():
+            content_to_send = "Hello."
+            
+        return chat_session, content_to_send
 
-        try:
-            # Make sure content is never empty to avoid Gemini API errors
-            if isinstance(content_to_send, str) and not content_to_send.strip():
-                content_to_send = "Hello."
+    def _parse_response_parts(self, parts: Any) -> Tuple[str, Optional[ToolRequest]]:
+        """
+        Extract the conversational text and first tool request from response parts.
+        
+        Returns:
+            The concatenated text and the tool request, if any
+        """
+        conversation_text = ""
+        tool_request_data = None
+        
+        for part in parts:
+            if hasattr(part, 'text') and part.text:
+                conversation_text += part.text
+            if hasattr(part, 'function_call') and part.function_call:
+                function_call = part.function_call
+                params = dict(function_call.args) if hasattr(function_call, "args") else {}
+                icerc_text = params.get("icerc_full_text", "Warning: Missing ICERC protocol text from LLM.")
                 
+                tool_request_data = ToolRequest( # Use TypedDict for creation
+                    request_id=f"{function_call.name}-{os.urandom(4).hex()}",
+                    tool_name=function_call.name,
+                    parameters=params,
+                    icerc_full_text=icerc_text
+                )
+                break 
+        
+        return conversation_text, tool_request_data
+    
+    @staticmethod
+    def _response_parts(response: Any) -> Any:
+        """Return the parts of a response's first candidate, or an empty list."""
+        if hasattr(response, 'candidates') and response.candidates and response.candidates[0].content:
+            return response.candidates[0].content.parts
+        return []
+    
+    def send_message_sequence(
+        self, 
+        messages: List[Message], 
+        active_persona_id: Optional[str] = None
+    ) -> LLMResponse:
+        turn = self._prepare_chat_turn(messages, active_persona_id)
+        if isinstance(turn, dict): # Nothing to send
+            return turn
+        chat_session, content_to_send = turn
+
+        try:
             response = chat_session.send_message(content_to_send)
             
-            conversation_text = ""
-            tool_request_data = None
-            
-            if hasattr(response, 'candidates') and response.candidates and response.candidates[0].content:
-                content_obj = response.candidates[0].content
-                
-                for part in content_obj.parts:
-                    if hasattr(part, 'text') and part.text:
-                        conversation_text += part.text
-                    if hasattr(part, 'function_call') and part.function_call:
-                        function_call = part.function_call
-                        params = dict(function_call.args) if hasattr(function_call, "args") else {}
-                        icerc_text = params.get("icerc_full_text", "Warning: Missing ICERC protocol text from LLM.")
-                        
-                        tool_request_data = ToolRequest( # Use TypedDict for creation
-                            request_id=f"{function_call.name}-{os.urandom(4).hex()}",
-                            tool_name=function_call.name,
-                            parameters=params,
-                            icerc_full_text=icerc_text
-                        )
-                        break 
+            conversation_text, tool_request_data = self._parse_response_parts(self._response_parts(response))
             
             return LLMResponse(conversation=conversation_text, tool_request=tool_request_data)
             
@@ -301,4 +334,29 @@ class GeminiAdapter(LLMAdapterInterface):
             return LLMResponse(
                 conversation=f"Error communicating with Gemini API: {str(e)}",
                 tool_request=None
+            )
+    
+    def stream_message_sequence(
+        self, 
+        messages: List[Message], 
+        active_persona_id: Optional[str] = None
+    ) -> Iterator[LLMResponse]:
+        turn = self._prepare_chat_turn(messages, active_persona_id)
+        if isinstance(turn, dict): # Nothing to send
+            yield turn
+            return
+        chat_session, content_to_send = turn
+
+        try:
+            for chunk in chat_session.send_message(content_to_send, stream=True):
+                conversation_text, tool_request_data = self._parse_response_parts(self._response_parts(chunk))
+                yield LLMResponse(conversation=conversation_text, tool_request=tool_request_data)
+                if tool_request_data:
+                    # As in send_message_sequence, only the first tool request is used
+                    return
+                
+        except Exception as e:
+            yield LLMResponse(
+                conversation=f"Error communicating with Gemini API: {str(e)}",
+                tool_request=None
             )
\ No newline at end of file
@@ -4,7 +4,7 @@ LLM Interaction Abstraction Layer (LIAL) manager for the Framework Core Applicat
 This module provides an interface for interacting with the LIAL component.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Union
 
 from framework_core.utils.logging_utils import setup_logger
 from framework_core.exceptions import LIALInitError, ConfigError # Added ConfigError
@@ -98,16 +98,23 @@ class LIALManager:
             self.logger.error(error_msg)
             raise LIALInitError(error_msg) # Changed from ValueError to LIALInitError
             
-    def send_messages(self, messages: List[Dict[str, Any]], active_persona_id: Optional[str] = None) -> Dict[str, Any]:
+    def send_messages(
+        self, 
+        messages: List[Dict[str, Any]], 
+        active_persona_id: Optional[str] = None, 
+        stream: bool = False
+    ) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
         Send messages to the LLM and get a response.
         
         Args:
             messages: List of message dictionaries
             active_persona_id: Optional ID of the active persona.
+            stream: If True, return an iterator of response chunks as they arrive
             
         Returns:
-            LLM response dictionary with conversation and optional tool request
+            LLM response dictionary with conversation and optional tool request,
+            or an iterator of such dictionaries when streaming
             
         Raises:
             LIALInitError: If LIAL is not initialized
@@ -118,4 +125,6 @@ class LIALManager:
             raise LIALInitError(error_msg)
             
         self.logger.info(f"Sending {len(messages)} messages to LLM using persona: {active_persona_id or 'default'}")
+        if stream:
+            return self.adapter_instance.stream_message_sequence(messages, active_persona_id=active_persona_id)
         return self.adapter_instance.send_message_sequence(messages, active_persona_id=active_persona_id)
\ No newline at end of file
@@ -120,7 +120,8 @@ class ConfigurationManager:
                 "assistant_prefix": "(Catalyst): ", # Default matches the default_persona for better UX
                 "system_prefix": "[System]: ",
                 "error_prefix": "[Error]: ",
-                "use_color": True
+                "use_color": True,
+                "stream_responses": False # Display assistant replies as they are generated
             }
         }
         
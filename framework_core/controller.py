@@ -5,7 +5,10 @@ This module implements the Framework Controller, which orchestrates
 the initialization and operation of all components.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from framework_core.exceptions import (
     ConfigError, 
@@ -41,6 +44,9 @@ class FrameworkController:
         "/persona": "Switch active persona (e.g., /persona forge, /persona catalyst)"
     }
     
+    # Maximum number of LLM responses kept in the response cache
+    LLM_CACHE_SIZE = 256
+    
     def __init__(self, config_manager: 'ConfigurationManager'):
         """
         Initialize the Framework Controller with configuration.
@@ -59,7 +65,21 @@ class FrameworkController:
         self.error_handler = ErrorHandler()
         self.running = False
         self.debug_mode = False
+        self.stream_responses = False  # Will be set during initialize
         self.active_persona_id = None  # Will be set during _setup_initial_context
+        # Responses are only cached for deterministic (temperature 0) LLM settings
+        self.llm_cache_enabled = False  # Will be set during _initialize_lial
+        self._llm_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Special command handlers, built once so each command is a single lookup
+        self._special_command_handlers = {
+            "/help": self._command_help,
+            "/quit": self._command_quit,
+            "/exit": self._command_quit,
+            "/clear": self._command_clear,
+            "/system": self._command_system,
+            "/debug": self._command_debug,
+            "/persona": self._command_persona,
+        }
         
     def initialize(self) -> bool:
         """
@@ -90,9 +110,9 @@ class FrameworkController:
             )
             
             # Initialize UI manager
-            self.ui_manager = UserInterfaceManager(
-                config=self.config_manager.get_ui_settings()
-            )
+            ui_settings = self.config_manager.get_ui_settings()
+            self.ui_manager = UserInterfaceManager(config=ui_settings)
+            self.stream_responses = ui_settings.get("stream_responses", False)
             
             # Initialize tool request handler
             if not self.teps_manager: # Ensure teps_manager is initialized
@@ -166,6 +186,8 @@ class FrameworkController:
             )
             self.lial_manager.initialize()
             
+            self.llm_cache_enabled = provider_llm_settings.get("temperature") == 0
+            
             self.logger.info("LIAL initialization successful")
             return True
             
@@ -266,18 +288,22 @@ class FrameworkController:
                 # Get messages in LLM format
                 messages = self.message_manager.get_messages(for_llm=True)
                 
-                # Send messages to LLM via LIAL
-                llm_response = self._process_messages_with_llm(messages)
+                # Send messages to LLM via LIAL, displaying the reply as it streams in if enabled
+                if self.stream_responses:
+                    llm_response = self._stream_messages_with_llm(messages)
+                else:
+                    llm_response = self._process_messages_with_llm(messages)
                 
                 # Add assistant message to history
                 if "conversation" in llm_response and llm_response["conversation"]:
                     assistant_message = llm_response["conversation"]
                     self.message_manager.add_assistant_message(assistant_message)
-                    self.ui_manager.display_assistant_message(assistant_message)
+                    if not self.stream_responses:
+                        self.ui_manager.display_assistant_message(assistant_message)
                 
                 # Handle tool requests if present
                 if "tool_request" in llm_response and llm_response["tool_request"]:
-                    self._handle_tool_request(llm_response["tool_request"])
+                    self._handle_tool_requests(llm_response["tool_request"])
                     
                     # Continue the conversation without user input if a tool was called
                     continue # This makes the LLM respond to the tool result immediately
@@ -322,6 +348,10 @@ class FrameworkController:
             LLMResponse containing conversation and optional tool request
         """
         try:
+            cache_key, cached_response = self._lookup_llm_cache(messages)
+            if cached_response is not None:
+                return cached_response
+            
             self.logger.debug(f"Sending {len(messages)} messages to LLM using persona: {self.active_persona_id}")
             llm_response = self.lial_manager.send_messages(messages, active_persona_id=self.active_persona_id)
             
@@ -332,9 +362,12 @@ class FrameworkController:
                     "conversation": "I encountered an issue processing your request. Please try again.",
                     "tool_request": None
                 }
-            elif "conversation" not in llm_response: # Ensure conversation key exists
-                 llm_response["conversation"] = "Received a response without conversational text."
-
+            else:
+                if "conversation" not in llm_response: # Ensure conversation key exists
+                    llm_response["conversation"] = "Received a response without conversational text."
+                
+                if cache_key is not None:
+                    self._cache_llm_response(cache_key, llm_response)
 
             return llm_response
             
@@ -345,6 +378,131 @@ class FrameworkController:
                 "tool_request": None
             }
         
+    def _stream_messages_with_llm(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Process messages with the LLM via LIAL, displaying the reply as it arrives.
+        
+        Args:
+            messages: List of messages to send to the LLM
+            
+        Returns:
+            LLMResponse containing the complete conversation and optional tool request
+        """
+        try:
+            cache_key, cached_response = self._lookup_llm_cache(messages)
+            if cached_response is not None:
+                self.ui_manager.stream_assistant_chunk(cached_response["conversation"])
+                return cached_response
+            
+            self.logger.debug(f"Streaming {len(messages)} messages to LLM using persona: {self.active_persona_id}")
+            conversation_parts = []
+            tool_request = None
+            for chunk in self.lial_manager.send_messages(
+                messages, active_persona_id=self.active_persona_id, stream=True
+            ):
+                if chunk.get("conversation"):
+                    conversation_parts.append(chunk["conversation"])
+                    self.ui_manager.stream_assistant_chunk(chunk["conversation"])
+                if chunk.get("tool_request"):
+                    tool_request = chunk["tool_request"]
+            
+            llm_response = {
+                "conversation": "".join(conversation_parts),
+                "tool_request": tool_request
+            }
+            if cache_key is not None:
+                self._cache_llm_response(cache_key, llm_response)
+            
+            return llm_response
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming messages with LLM: {str(e)}", exc_info=True)
+            error_message = f"I encountered an error while communicating with the LLM: {str(e)}"
+            self.ui_manager.stream_assistant_chunk(error_message)
+            return {
+                "conversation": error_message,
+                "tool_request": None
+            }
+        finally:
+            self.ui_manager.end_assistant_stream()
+        
+    def _lookup_llm_cache(
+        self, 
+        messages: List[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up the cached LLM response for messages sent with the active persona.
+        
+        Args:
+            messages: List of messages to send to the LLM
+            
+        Returns:
+            Tuple of the cache key, or None if the response must not be cached,
+            and a copy of the cached response, or None on a cache miss
+        """
+        if not self.llm_cache_enabled:
+            return None, None
+        
+        cache_key = self._llm_cache_key(messages)
+        if cache_key not in self._llm_cache:
+            return cache_key, None
+        
+        self.logger.debug("Using cached LLM response")
+        self._llm_cache.move_to_end(cache_key)
+        return cache_key, dict(self._llm_cache[cache_key])
+        
+    def _llm_cache_key(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Build the response cache key for messages sent with the active persona.
+        
+        Args:
+            messages: List of messages to send to the LLM
+            
+        Returns:
+            Hex SHA-256 digest of the active persona and the serialized messages,
+            or None if the messages cannot be serialized and must not be cached
+        """
+        try:
+            serialized = json.dumps(messages, sort_keys=True, default=str)
+        except (TypeError, ValueError) as e:
+            self.logger.debug(f"Not caching LLM response, messages could not be serialized: {str(e)}")
+            return None
+        
+        key = hashlib.sha256(f"{self.active_persona_id}\n".encode("utf-8"))
+        key.update(serialized.encode("utf-8"))
+        return key.hexdigest()
+        
+    def _cache_llm_response(self, cache_key: str, llm_response: Dict[str, Any]) -> None:
+        """
+        Store an LLM response, evicting the least recently used one if the cache is full.
+        
+        Args:
+            cache_key: Key from _llm_cache_key
+            llm_response: The response to cache
+        """
+        self._llm_cache[cache_key] = dict(llm_response)
+        if len(self._llm_cache) > self.LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+        
+    def _handle_tool_requests(
+        self, 
+        tool_requests: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> None:
+        """
+        Handle the tool requests from a single LLM response.
+        
+        The requests are processed in order rather than concurrently, as TEPS
+        asks the user to confirm each tool execution.
+        
+        Args:
+            tool_requests: A tool request, or a list of tool requests
+        """
+        if isinstance(tool_requests, dict):
+            tool_requests = [tool_requests]
+            
+        for tool_request in tool_requests:
+            self._handle_tool_request(tool_request)
+        
     def _handle_tool_request(self, tool_request: Dict[str, Any]) -> None:
         """
         Handle a tool request via the Tool Request Handler.
@@ -422,99 +580,101 @@ class FrameworkController:
         if user_input.startswith("/"):
             command_parts = user_input.split(" ", 1)
             command = command_parts[0].lower()
+            argument = command_parts[1] if len(command_parts) > 1 else ""
             
-            if command in ["/quit", "/exit"]:
-                self.ui_manager.display_system_message("Exiting application...")
-                self.running = False
-                return True
-                
-            elif command == "/help":
-                self.ui_manager.display_special_command_help(self.SPECIAL_COMMANDS)
-                return True
-                
-            elif command == "/clear":
-                self.message_manager.clear_history(preserve_system=True)
-                self.ui_manager.display_system_message("Conversation history cleared.")
-                return True
-                
-            elif command == "/system":
-                # Add system message
-                system_content = command_parts[1].strip() if len(command_parts) > 1 else ""
-                if system_content:
-                    self.message_manager.add_system_message(system_content)
-                    self.ui_manager.display_system_message(f"Added system message: {system_content}")
-                else:
-                    self.ui_manager.display_error_message("Command Error", "Usage: /system <message_content>")
-                return True
-                
-            elif command == "/debug":
-                self.debug_mode = not self.debug_mode
-                status = "enabled" if self.debug_mode else "disabled"
-                self.ui_manager.display_system_message(f"Debug mode {status}.")
-                # Update logger level if debug mode is enabled/disabled
-                # This assumes logger setup in utils allows dynamic level changes, or we re-setup loggers.
-                # For simplicity, this might require more complex logger management.
-                # Example: logging.getLogger().setLevel(logging.DEBUG if self.debug_mode else logging.INFO)
-                return True
-                
-            elif command == "/persona":
-                # Switch active persona
-                new_persona_id = command_parts[1].strip().lower() if len(command_parts) > 1 else ""
-                
-                if not new_persona_id:
-                    # Display current persona if no parameter provided
-                    current_display = self.active_persona_id.capitalize() if self.active_persona_id else "None"
-                    self.ui_manager.display_system_message(f"Current active persona: {current_display}. Usage: /persona <persona_id>")
-                    return True
-                    
-                # Verify the requested persona exists
-                if not self.dcm_manager:
-                    self.ui_manager.display_error_message("Command Error", "DCM Manager not initialized.")
-                    return True
-                    
-                persona_definitions = self.dcm_manager.get_persona_definitions()
-                valid_persona_ids = [pid.replace("persona_", "") for pid in persona_definitions.keys()]
-                
-                if new_persona_id not in valid_persona_ids:
-                    self.ui_manager.display_error_message(
-                        "Command Error", 
-                        f"Invalid persona ID: {new_persona_id}. Valid personas: {', '.join(valid_persona_ids)}"
-                    )
-                    return True
-                
-                # Update active persona
-                old_persona_id = self.active_persona_id
-                self.active_persona_id = new_persona_id
-                
-                # Reset message history to ensure clean persona switch
-                # FULLY reset the history to ensure a complete switch
-                if self.message_manager:
-                    self.message_manager.clear_history(preserve_system=False)
-                    # Add explicit system messages about the persona
-                    if new_persona_id == "forge":
-                        switch_msg = "You are now Forge, the Expert AI Implementer & System Operator. You must fully embody the Forge persona's technical expertise and practical implementation focus. You are NOT Catalyst. Respond with Forge's implementation-focused, technical mindset."
-                    else: # catalyst
-                        switch_msg = "You are now Catalyst, the Visionary AI Strategist & Architect. You must fully embody the Catalyst persona's strategic thinking and architectural vision. You are NOT Forge. Respond with Catalyst's strategic, high-level mindset."
-                    
-                    self.message_manager.add_system_message(switch_msg)
-                
-                # Update UI prefix
-                if self.ui_manager:
-                    persona_display_name = new_persona_id.capitalize()
-                    prefix = f"({persona_display_name}): "
-                    self.ui_manager.set_assistant_prefix(prefix)
-                
-                # Log the change
-                self.logger.info(f"Active persona switched from {old_persona_id} to {new_persona_id}")
-                self.ui_manager.display_system_message(f"Active persona switched to {new_persona_id.capitalize()}.")
-                return True
-                
+            handler = self._special_command_handlers.get(command)
+            if handler:
+                handler(argument)
             else:
                 self.ui_manager.display_error_message("Command Error", f"Unknown command: {command}")
-                return True # Still processed as a (failed) command
+            return True # Unknown commands are still processed as (failed) commands
         
         return False
         
+    def _command_quit(self, argument: str) -> None:
+        """Handle the /quit and /exit commands."""
+        self.ui_manager.display_system_message("Exiting application...")
+        self.running = False
+        
+    def _command_help(self, argument: str) -> None:
+        """Handle the /help command."""
+        self.ui_manager.display_special_command_help(self.SPECIAL_COMMANDS)
+        
+    def _command_clear(self, argument: str) -> None:
+        """Handle the /clear command."""
+        self.message_manager.clear_history(preserve_system=True)
+        self.ui_manager.display_system_message("Conversation history cleared.")
+        
+    def _command_system(self, argument: str) -> None:
+        """Handle the /system command by adding a system message."""
+        system_content = argument.strip()
+        if system_content:
+            self.message_manager.add_system_message(system_content)
+            self.ui_manager.display_system_message(f"Added system message: {system_content}")
+        else:
+            self.ui_manager.display_error_message("Command Error", "Usage: /system <message_content>")
+            
+    def _command_debug(self, argument: str) -> None:
+        """Handle the /debug command by toggling debug mode."""
+        self.debug_mode = not self.debug_mode
+        status = "enabled" if self.debug_mode else "disabled"
+        self.ui_manager.display_system_message(f"Debug mode {status}.")
+        # Update logger level if debug mode is enabled/disabled
+        # This assumes logger setup in utils allows dynamic level changes, or we re-setup loggers.
+        # For simplicity, this might require more complex logger management.
+        # Example: logging.getLogger().setLevel(logging.DEBUG if self.debug_mode else logging.INFO)
+        
+    def _command_persona(self, argument: str) -> None:
+        """Handle the /persona command by switching the active persona."""
+        new_persona_id = argument.strip().lower()
+        
+        if not new_persona_id:
+            # Display current persona if no parameter provided
+            current_display = self.active_persona_id.capitalize() if self.active_persona_id else "None"
+            self.ui_manager.display_system_message(f"Current active persona: {current_display}. Usage: /persona <persona_id>")
+            return
+            
+        # Verify the requested persona exists
+        if not self.dcm_manager:
+            self.ui_manager.display_error_message("Command Error", "DCM Manager not initialized.")
+            return
+            
+        persona_definitions = self.dcm_manager.get_persona_definitions()
+        valid_persona_ids = [pid.replace("persona_", "") for pid in persona_definitions.keys()]
+        
+        if new_persona_id not in valid_persona_ids:
+            self.ui_manager.display_error_message(
+                "Command Error", 
+                f"Invalid persona ID: {new_persona_id}. Valid personas: {', '.join(valid_persona_ids)}"
+            )
+            return
+        
+        # Update active persona
+        old_persona_id = self.active_persona_id
+        self.active_persona_id = new_persona_id
+        
+        # Reset message history to ensure clean persona switch
+        # FULLY reset the history to ensure a complete switch
+        if self.message_manager:
+            self.message_manager.clear_history(preserve_system=False)
+            # Add explicit system messages about the persona
+            if new_persona_id == "forge":
+                switch_msg = "You are now Forge, the Expert AI Implementer & System Operator. You must fully embody the Forge persona's technical expertise and practical implementation focus. You are NOT Catalyst. Respond with Forge's implementation-focused, technical mindset."
+            else: # catalyst
+                switch_msg = "You are now Catalyst, the Visionary AI Strategist & Architect. You must fully embody the Catalyst persona's strategic thinking and architectural vision. You are NOT Forge. Respond with Catalyst's strategic, high-level mindset."
+            
+            self.message_manager.add_system_message(switch_msg)
+        
+        # Update UI prefix
+        if self.ui_manager:
+            persona_display_name = new_persona_id.capitalize()
+            prefix = f"({persona_display_name}): "
+            self.ui_manager.set_assistant_prefix(prefix)
+        
+        # Log the change
+        self.logger.info(f"Active persona switched from {old_persona_id} to {new_persona_id}")
+        self.ui_manager.display_system_message(f"Active persona switched to {new_persona_id.capitalize()}.")
+        
     def shutdown(self) -> None:
         """
         Perform graceful shutdown of the framework.
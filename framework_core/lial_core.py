@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, TypedDict, Any, Union
+from typing import Dict, Iterator, List, Optional, TypedDict, Any, Union
 
 # Message Types
 class Message(TypedDict, total=False):
@@ -91,4 +91,25 @@ class LLMAdapterInterface(ABC):
         Returns:
             LLMResponse containing conversational text and optional tool request
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def stream_message_sequence(
+        self, 
+        messages: List[Message], 
+        active_persona_id: Optional[str] = None
+    ) -> Iterator[LLMResponse]:
+        """
+        Send a sequence of messages to the LLM and yield the response as it arrives.
+        
+        Each chunk's conversation holds the next piece of conversational text;
+        a tool request is carried by the chunk in which it arrives. Adapters
+        without native streaming yield the complete response as one chunk.
+        
+        Args:
+            messages: List of Message objects representing the conversation history
+            active_persona_id: Optional ID of the active persona to use
+        
+        Yields:
+            LLMResponse chunks
+        """
+        yield self.send_message_sequence(messages, active_persona_id=active_persona_id)
@@ -11,6 +11,18 @@ from typing import Callable, Optional, Dict, Any, List
 
 from framework_core.utils.logging_utils import setup_logger
 
+# ANSI color codes
+_RESET = "\033[0m"
+_BOLD = "\033[1m"
+_RED = "\033[31m"
+_GREEN = "\033[32m"
+_YELLOW = "\033[33m"
+_BLUE = "\033[34m"
+_MAGENTA = "\033[35m"
+_CYAN = "\033[36m"
+_WHITE = "\033[37m"
+_GRAY = "\033[90m"
+
 class UserInterfaceManager:
     """
     Manages user interface interactions, including input/output and formatting.
@@ -18,16 +30,16 @@ class UserInterfaceManager:
     
     # ANSI color codes
     COLORS = {
-        "reset": "\033[0m",
-        "bold": "\033[1m",
-        "red": "\033[31m",
-        "green": "\033[32m",
-        "yellow": "\033[33m",
-        "blue": "\033[34m",
-        "magenta": "\033[35m",
-        "cyan": "\033[36m",
-        "white": "\033[37m",
-        "gray": "\033[90m"
+        "reset": _RESET,
+        "bold": _BOLD,
+        "red": _RED,
+        "green": _GREEN,
+        "yellow": _YELLOW,
+        "blue": _BLUE,
+        "magenta": _MAGENTA,
+        "cyan": _CYAN,
+        "white": _WHITE,
+        "gray": _GRAY
     }
     
     def __init__(
@@ -58,16 +70,63 @@ class UserInterfaceManager:
         # Check if color is supported and enabled
         self.use_color = self.config.get("use_color", self._supports_color())
         
+        self._rebuild_prefixes()
+        
+        # State for streamed assistant messages
+        self._stream_started = False
+        self._stream_buffer: List[str] = []
+        
     def display_assistant_message(self, message: str) -> None:
         """
         Display an assistant message to the user.
         
+        Empty messages are not printed by the default output handler; a
+        custom handler still receives them.
+        
         Args:
             message: The message to display
         """
+        if not message and self.output_handler == self._default_output_handler:
+            return
         formatted_message = self._format_assistant_message(message)
         self.output_handler(formatted_message)
         
+    def stream_assistant_chunk(self, chunk: str) -> None:
+        """
+        Display part of an assistant message as it arrives.
+        
+        The assistant prefix is shown before the first chunk only. With the
+        default output handler chunks are written straight to stdout; with a
+        custom handler they are buffered and passed on as one message by
+        end_assistant_stream().
+        
+        Args:
+            chunk: The next piece of the assistant message
+        """
+        if not chunk:
+            return
+        if self.output_handler != self._default_output_handler:
+            self._stream_buffer.append(chunk)
+            return
+        if not self._stream_started:
+            self._stream_started = True
+            chunk = self._assistant_prefix_str + chunk
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        
+    def end_assistant_stream(self) -> None:
+        """
+        Finish an assistant message started with stream_assistant_chunk().
+        """
+        if self._stream_buffer:
+            message = "".join(self._stream_buffer)
+            self._stream_buffer = []
+            self.display_assistant_message(message)
+        elif self._stream_started:
+            self._stream_started = False
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+        
     def set_assistant_prefix(self, prefix: str) -> None:
         """
         Set a new assistant prefix for message display.
@@ -76,15 +135,21 @@ class UserInterfaceManager:
             prefix: The new prefix to use for assistant messages
         """
         self.assistant_prefix = prefix
-        self.logger.debug(f"Assistant prefix updated to: {prefix}")
+        self._rebuild_prefixes()
+        self.logger.debug("Assistant prefix updated to: %s", prefix)
         
     def display_system_message(self, message: str) -> None:
         """
         Display a system message to the user.
         
+        Empty messages are not printed by the default output handler; a
+        custom handler still receives them.
+        
         Args:
             message: The message to display
         """
+        if not message and self.output_handler == self._default_output_handler:
+            return
         formatted_message = self._format_system_message(message)
         self.output_handler(formatted_message)
         
@@ -92,10 +157,16 @@ class UserInterfaceManager:
         """
         Display an error message to the user.
         
+        Nothing is printed by the default output handler if both the type and
+        the message are empty; a custom handler still receives the message.
+        
         Args:
             error_type: The type of error
             error_message: The error message
         """
+        if (not error_type and not error_message
+                and self.output_handler == self._default_output_handler):
+            return
         formatted_message = self._format_error_message(error_type, error_message)
         self.output_handler(formatted_message)
         
@@ -120,6 +191,11 @@ class UserInterfaceManager:
         """
         Get multi-line input from the user.
         
+        When the default input handler is in use and stdin is not a TTY
+        (e.g. piped input), lines are read from stdin directly rather than
+        through input(); reading stops at the end marker, so later input is
+        left for the next call.
+        
         Args:
             prompt: Optional custom prompt
             end_marker: String that marks the end of input
@@ -133,14 +209,25 @@ class UserInterfaceManager:
         
         self.output_handler(prompt)
         
+        if self.input_handler == self._default_input_handler and not self._stdin_is_tty():
+            lines = []
+            for line in sys.stdin:
+                line = line.rstrip("\r\n")
+                if line == end_marker:
+                    break
+                lines.append(line)
+            return "\n".join(lines)
+        
         lines = []
+        append = lines.append
+        handler = self.input_handler
         while True:
-            line = self.input_handler("")
+            line = handler("")
             
             if (not line and not end_marker) or line == end_marker:
                 break
                 
-            lines.append(line)
+            append(line)
             
         return "\n".join(lines)
         
@@ -154,16 +241,31 @@ class UserInterfaceManager:
         if not commands:
             return
             
-        help_message = "Available Commands:\n\n"
-        
         max_len = max(len(cmd) for cmd in commands.keys())
         
-        for cmd, desc in sorted(commands.items()):
-            help_message += f"  {cmd.ljust(max_len)}  - {desc}\n"
+        parts = ["Available Commands:\n\n"]
+        append = parts.append
+        for cmd in sorted(commands):
+            append(f"  {cmd.ljust(max_len)}  - {commands[cmd]}\n")
             
+        help_message = "".join(parts)
         formatted_message = self._format_system_message(help_message)
         self.output_handler(formatted_message)
         
+    def _rebuild_prefixes(self) -> None:
+        """
+        Render the message prefixes, including color codes, once so the
+        display methods only need a single concatenation per message.
+        """
+        if self.use_color:
+            self._assistant_prefix_str = f"{_GREEN}{_BOLD}{self.assistant_prefix}{_RESET}"
+            self._system_prefix_str = f"{_BLUE}{_BOLD}{self.system_prefix}{_RESET}"
+            self._error_prefix_str = f"{_RED}{_BOLD}{self.error_prefix}{_RESET}"
+        else:
+            self._assistant_prefix_str = self.assistant_prefix
+            self._system_prefix_str = self.system_prefix
+            self._error_prefix_str = self.error_prefix
+        
     def _format_assistant_message(self, message: str) -> str:
         """
         Format an assistant message for display.
@@ -174,12 +276,7 @@ class UserInterfaceManager:
         Returns:
             Formatted message
         """
-        if self.use_color:
-            prefix = f"{self.COLORS['green']}{self.COLORS['bold']}{self.assistant_prefix}{self.COLORS['reset']}"
-        else:
-            prefix = self.assistant_prefix
-            
-        return f"{prefix}{message}"
+        return self._assistant_prefix_str + message
         
     def _format_system_message(self, message: str) -> str:
         """
@@ -191,12 +288,7 @@ class UserInterfaceManager:
         Returns:
             Formatted message
         """
-        if self.use_color:
-            prefix = f"{self.COLORS['blue']}{self.COLORS['bold']}{self.system_prefix}{self.COLORS['reset']}"
-        else:
-            prefix = self.system_prefix
-            
-        return f"{prefix}{message}"
+        return self._system_prefix_str + message
         
     def _format_error_message(self, error_type: str, error_message: str) -> str:
         """
@@ -210,13 +302,9 @@ class UserInterfaceManager:
             Formatted message
         """
         if self.use_color:
-            prefix = f"{self.COLORS['red']}{self.COLORS['bold']}{self.error_prefix}{self.COLORS['reset']}"
-            error_type_str = f"{self.COLORS['red']}{self.COLORS['bold']}{error_type}{self.COLORS['reset']}"
-        else:
-            prefix = self.error_prefix
-            error_type_str = error_type
+            return f"{self._error_prefix_str}{_RED}{_BOLD}{error_type}{_RESET}: {error_message}"
             
-        return f"{prefix}{error_type_str}: {error_message}"
+        return f"{self._error_prefix_str}{error_type}: {error_message}"
         
     def _default_input_handler(self, prompt: str) -> str:
         """
@@ -248,31 +336,55 @@ class UserInterfaceManager:
         """
         print(message)
         
+    def _stdin_is_tty(self) -> bool:
+        """
+        Check if stdin is attached to a terminal.
+        
+        Returns:
+            True if stdin is a TTY, False otherwise
+        """
+        return hasattr(sys.stdin, "isatty") and sys.stdin.isatty()
+        
     def _supports_color(self) -> bool:
         """
         Check if the terminal supports color output.
         
+        The check is performed once at import time; see _detect_color_support.
+        
         Returns:
             True if color is supported, False otherwise
         """
-        # Check if NO_COLOR environment variable is set
-        if os.environ.get("NO_COLOR") is not None:
-            return False
-            
-        # Check if output is a TTY
-        if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
-            return False
-            
-        # Check platform-specific color support
-        platform = sys.platform.lower()
-        if platform == "win32":
-            # On Windows, check for ANSICON or ConEMU or Windows Terminal
-            return (
-                "ANSICON" in os.environ
-                or "WT_SESSION" in os.environ
-                or "ConEmuANSI" in os.environ
-                or os.environ.get("TERM_PROGRAM") == "vscode"
-            )
-        else:
-            # On Unix-like platforms, check TERM environment variable
-            return os.environ.get("TERM") not in (None, "", "dumb")
\ No newline at end of file
+        return _COLOR_SUPPORTED
+
+
+def _detect_color_support() -> bool:
+    """
+    Check if the terminal supports color output.
+    
+    Returns:
+        True if color is supported, False otherwise
+    """
+    # Check if NO_COLOR environment variable is set
+    if os.environ.get("NO_COLOR") is not None:
+        return False
+        
+    # Check if output is a TTY
+    if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
+        return False
+        
+    # Check platform-specific color support
+    platform = sys.platform.lower()
+    if platform == "win32":
+        # On Windows, check for ANSICON or ConEMU or Windows Terminal
+        return (
+            "ANSICON" in os.environ
+            or "WT_SESSION" in os.environ
+            or "ConEmuANSI" in os.environ
+            or os.environ.get("TERM_PROGRAM") == "vscode"
+        )
+    else:
+        # On Unix-like platforms, check TERM environment variable
+        return os.environ.get("TERM") not in (None, "", "dumb")
+
+
+_COLOR_SUPPORTED = _detect_color_support()
@@ -6,7 +6,20 @@ This module provides functions for setting up and configuring loggers.
 
 import logging
 import os
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
+
+# Default log format and a shared formatter for it
+_DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_LOG_FORMAT)
+
+# Level names accepted by setup_logger
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "FATAL", "CRITICAL")
+}
+
+# Maps logger name to the arguments it was last configured with and the logger
+_LOGGER_CACHE: Dict[str, Tuple[tuple, logging.Logger]] = {}
 
 def setup_logger(
     name: str, 
@@ -17,6 +30,9 @@ def setup_logger(
     """
     Set up and configure a logger with the given name.
     
+    Repeated calls with the same arguments return the already configured
+    logger without rebuilding its handlers.
+    
     Args:
         name: The name of the logger
         level: Optional logging level (if None, uses INFO)
@@ -27,25 +43,31 @@ def setup_logger(
     Returns:
         Configured logger
     """
+    # Get or create logger
+    logger = logging.getLogger(name)
+    
+    # Skip reconfiguration if nothing changed since the last call
+    key = (level, log_file, log_format)
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None and cached[0] == key and cached[1] is logger and logger.handlers:
+        return logger
+    
     # Default to INFO if no level specified
     if level is None:
         level = "INFO"
         
     # Convert string level to logging constant if needed
     if isinstance(level, str):
-        numeric_level = getattr(logging, level.upper(), logging.INFO)
+        numeric_level = _LEVELS.get(level if level.isupper() else level.upper(), logging.INFO)
     else:
         numeric_level = level
     
-    # Default log format
+    # Create formatter, reusing the shared one for the default format
     if log_format is None:
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Create formatter
-    formatter = logging.Formatter(log_format)
+        formatter = _DEFAULT_FORMATTER
+    else:
+        formatter = logging.Formatter(log_format)
     
-    # Get or create logger
-    logger = logging.getLogger(name)
     logger.setLevel(numeric_level)
     
     # Clear existing handlers to prevent duplicates
@@ -75,4 +97,6 @@ def setup_logger(
         # Add file handler to logger
         logger.addHandler(file_handler)
     
+    _LOGGER_CACHE[name] = (key, logger)
+    
     return logger
\ No newline at end of file
@@ -9,7 +9,7 @@ fi
 
 # Install pytest and related dependencies
 echo "Installing test dependencies..."
-pip install pytest pytest-cov pytest-mock
+pip install pytest pytest-cov pytest-mock pytest-xdist
 
 # Run the tests
 echo "Running DCM tests..."
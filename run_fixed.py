@@ -11,8 +11,6 @@ from typing import Dict, Any
 # Add parent directory to path if needed
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from framework_core.config_loader import ConfigurationManager
-from framework_core.controller import FrameworkController
 from framework_core.utils.logging_utils import setup_logger
 from framework_core.exceptions import ConfigError, ComponentInitError
 
@@ -39,6 +37,11 @@ def main() -> int:
             print(f"ERROR: Configuration file not found: {config_path}")
             return 1
             
+        # Deferred so a missing config file fails fast without importing
+        # the controller and LLM provider graph
+        from framework_core.config_loader import ConfigurationManager
+        from framework_core.controller import FrameworkController
+        
         # Initialize configuration
         config_manager = ConfigurationManager(config_path)
         if not config_manager.load_configuration():
@@ -61,12 +64,12 @@ def main() -> int:
         return 0
         
     except ConfigError as e:
-        logger.error(f"Configuration error: {str(e)}")
+        logger.error("Configuration error: %s", e)
         print(f"Configuration error: {str(e)}")
         return 1
         
     except ComponentInitError as e:
-        logger.error(f"Component initialization error: {str(e)}")
+        logger.error("Component initialization error: %s", e)
         print(f"Component initialization error: {str(e)}")
         return 1
         
@@ -76,7 +79,7 @@ def main() -> int:
         return 0
         
     except Exception as e:
-        logger.exception(f"Unhandled exception: {str(e)}")
+        logger.exception("Unhandled exception: %s", e)
         print(f"Unhandled exception: {str(e)}")
         return 1
 
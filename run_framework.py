@@ -13,10 +13,8 @@ from typing import Dict, Any
 # Add parent directory to path if needed
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from framework_core.config_loader import ConfigurationManager
-from framework_core.controller import FrameworkController
-from framework_core.utils.logging_utils import setup_logger
-from framework_core.exceptions import ConfigError, ComponentInitError
+# framework_core imports are deferred to main() so that --help and invalid
+# arguments do not pay for importing the controller and LLM provider graph
 
 def parse_arguments() -> tuple:
     """
@@ -70,12 +68,18 @@ def main() -> int:
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
+    # Parse command-line arguments
+    config_path, cmd_args = parse_arguments()
+    
+    from framework_core.utils.logging_utils import setup_logger
+    from framework_core.exceptions import ConfigError, ComponentInitError
+    
     logger = setup_logger("main")
     logger.info("Starting Framework Core Application")
     
     try:
-        # Parse command-line arguments
-        config_path, cmd_args = parse_arguments()
+        from framework_core.config_loader import ConfigurationManager
+        from framework_core.controller import FrameworkController
         
         # Initialize configuration
         config_manager = ConfigurationManager(config_path, cmd_args)
@@ -95,12 +99,12 @@ def main() -> int:
         return 0
         
     except ConfigError as e:
-        logger.error(f"Configuration error: {str(e)}")
+        logger.error("Configuration error: %s", e)
         print(f"Configuration error: {str(e)}")
         return 1
         
     except ComponentInitError as e:
-        logger.error(f"Component initialization error: {str(e)}")
+        logger.error("Component initialization error: %s", e)
         print(f"Component initialization error: {str(e)}")
         return 1
         
@@ -110,7 +114,7 @@ def main() -> int:
         return 0
         
     except Exception as e:
-        logger.exception(f"Unhandled exception: {str(e)}")
+        logger.exception("Unhandled exception: %s", e)
         print(f"Unhandled exception: {str(e)}")
         return 1
 
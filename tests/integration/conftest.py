@@ -8,136 +8,198 @@ KeystoneAI-Framework, including:
 - Mock setup for external dependencies
 """
 
-import os
-import sys
+import copy
+import functools
+import json
 import pytest
-from unittest.mock import MagicMock, patch
-from typing import Dict, Any, List, Optional
-
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from framework_core.exceptions import (
-    ConfigError, 
-    DCMInitError, 
-    LIALInitError, 
-    TEPSInitError,
-    ComponentInitError,
-    ToolExecutionError
-)
-from framework_core.lial_core import Message, LLMResponse, ToolRequest, ToolResult
+from dataclasses import dataclass
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 from tests.integration.utils import MockLLMAdapter, ResponseBuilder, MockIOCapture
 
+# The end-to-end fixtures live in their own module. Importing them here makes
+# them available to every integration test, as pytest only honours
+# pytest_plugins in the top-level conftest.
+from tests.integration.e2e_fixtures import (
+    scenario_builder,
+    basic_scenario,
+    tool_scenario,
+    command_scenario,
+    error_scenario,
+    e2e_controller,
+    mock_conversation,
+    e2e_test_data,
+    setup_pyfakefs_for_e2e,
+)
 
-# Configuration fixtures
 
-@pytest.fixture
-def mock_minimal_config():
-    """Provide a minimal valid configuration."""
+# Mock templates
+#
+# Behaviour that does not depend on per-test state is defined once here and
+# applied with MagicMock(**template), so each fixture builds its mock in a
+# single configure step. Every test still gets its own mock instance: shared
+# or shallow-copied mocks would share call history. autospec is deliberately
+# not used for these per-test mocks, as it is by far the most expensive way to
+# construct a mock; controller_component_specs builds its autospecs once per
+# module instead.
+#
+# Leaf components that are never used through magic methods (UI manager,
+# tool request handler, error handler) use plain Mock, which is cheaper than
+# MagicMock while still recording calls for assertions.
+
+# Public methods of the components mocked with spec_set
+_TOOL_REQUEST_HANDLER_METHODS = [
+    "process_tool_request",
+    "process_batch_tool_requests",
+    "format_tool_result_as_message",
+]
+
+_ERROR_HANDLER_METHODS = ["handle_error"]
+
+_dumps = json.dumps
+
+
+def _format_tool_result_as_message(tool_result):
+    """Format a tool result as a message, mirroring ToolRequestHandler."""
+    # Extract data
+    tool_name = tool_result.get("tool_name", "unknown")
+    request_id = tool_result.get("request_id", "unknown")
+    content = tool_result.get("data", {})
+    
+    # Format content as string if needed
+    if not isinstance(content, str):
+        try:
+            content = _dumps(content)
+        except (TypeError, ValueError):
+            content = str(content)
+    
     return {
-        "llm_provider": "mock",
-        "context_definition_file": "/path/to/FRAMEWORK_CONTEXT.md",
+        "role": "tool_result",
+        "content": content,
+        "tool_name": tool_name,
+        "tool_call_id": request_id
     }
 
 
-@pytest.fixture
-def mock_complete_config():
-    """Provide a complete configuration with all settings."""
+def _handle_error(error_type, message, exception=None):
+    """Format an error, mirroring ErrorHandler.handle_error."""
+    formatted_message = f"{error_type}: {message}"
+    if exception:
+        formatted_message += f" ({type(exception).__name__})"
+    return formatted_message
+
+
+
+# Results returned by the mock TEPS execute_tool, by tool name
+def _read_file_result(tool_request, request_id, tool_name):
     return {
-        "llm_provider": "mock",
-        "context_definition_file": "/path/to/FRAMEWORK_CONTEXT.md",
-        "default_persona": "forge",
-        "llm_settings": {
-            "model_name": "mock-llm",
-            "temperature": 0.7,
-            "max_tokens": 1000,
-            "api_key_env_var": "MOCK_API_KEY",
-            "system_instruction_id": "main_system_prompt"
-        },
-        "teps_settings": {
-            "bash": {
-                "allowed_commands": ["ls", "echo", "cat"],
-                "max_execution_time": 30
-            },
-            "dry_run_enabled": True
-        },
-        "ui_settings": {
-            "prompt_prefix": "> ",
-            "output_formatting": "colorized"
-        },
-        "message_history_settings": {
-            "max_length": 100,
-            "pruning_strategy": "remove_oldest",
-            "prioritize_system_messages": True
-        }
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "success",
+        "data": "Content of the requested file."
     }
 
 
-@pytest.fixture
-def mock_io_capture():
-    """Provide a MockIOCapture instance for testing UI interactions."""
-    io_capture = MockIOCapture()
-    io_capture.start_capture()
-    io_capture.patch_input()
-    
-    yield io_capture
-    
-    io_capture.reset()
+def _write_file_result(tool_request, request_id, tool_name):
+    return {
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "success",
+        "data": {"bytes_written": 123, "path": tool_request.get("parameters", {}).get("file_path")}
+    }
 
 
-# Component fixtures
+def _bash_command_result(tool_request, request_id, tool_name):
+    return {
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "success",
+        "data": "Command output here"
+    }
 
-@pytest.fixture
-def mock_dcm_instance():
-    """Provide a mock DCM instance."""
-    mock_dcm = MagicMock(name="DynamicContextManager")
-    
-    # Configure common methods
-    mock_dcm.get_document_content.side_effect = lambda doc_id: (
-        "Base system instruction text" if doc_id == "main_system_prompt" 
-        else ("# Catalyst Persona\nThe strategic AI planner." if doc_id == "persona_catalyst"
-              else ("# Forge Persona\nThe expert AI implementer." if doc_id == "persona_forge"
-                    else None))
-    )
-    
-    mock_dcm.get_initial_prompt_template.return_value = (
-        "You are an AI assistant in the KeystoneAI-Framework. "
-        "You can help users with a variety of tasks."
-    )
-    
-    mock_dcm.get_full_initial_context.return_value = {
-        "main_system_prompt": "Base system instruction text",
-        "persona_catalyst": "# Catalyst Persona\nThe strategic AI planner.",
-        "persona_forge": "# Forge Persona\nThe expert AI implementer."
+
+def _tool_error_result(tool_request, request_id, tool_name):
+    return {
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "error",
+        "data": {"error_message": "Tool execution failed"}
     }
-    
-    mock_dcm.get_persona_definitions.return_value = {
-        "catalyst": "# Catalyst Persona\nThe strategic AI planner.",
-        "forge": "# Forge Persona\nThe expert AI implementer."
+
+
+def _tool_default_result(tool_request, request_id, tool_name):
+    return {
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "success",
+        "data": {"message": "Tool executed successfully"}
     }
-    
-    return mock_dcm
 
 
-@pytest.fixture
-def mock_dcm_manager(mock_dcm_instance):
-    """Provide a mock DCMManager instance."""
-    mock_manager = MagicMock(name="DCMManager")
-    mock_manager.dcm_instance = mock_dcm_instance
-    
-    # Configure manager methods to delegate to dcm_instance
-    mock_manager.get_initial_prompt.return_value = mock_dcm_instance.get_initial_prompt_template()
-    mock_manager.get_full_context.return_value = mock_dcm_instance.get_full_initial_context()
-    mock_manager.get_document_content.side_effect = mock_dcm_instance.get_document_content
-    mock_manager.get_persona_definitions.return_value = mock_dcm_instance.get_persona_definitions()
+_TOOL_HANDLERS = {
+    "readFile": _read_file_result,
+    "writeFile": _write_file_result,
+    "executeBashCommand": _bash_command_result,
+}
+
+
+def _execute_tool(tool_request):
+    """Mock TEPS execute_tool shared by the TEPS instance and manager mocks."""
+    tool_name = tool_request.get("tool_name", "unknown")
+    request_id = tool_request.get("request_id", "unknown")
     
-    return mock_manager
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        handler = _tool_error_result if "error" in tool_name.lower() else _tool_default_result
+    return handler(tool_request, request_id, tool_name)
 
 
-@pytest.fixture
-def mock_llm_adapter():
-    """Provide a mock LLM adapter instance."""
+# Document content served by the mock DCM, keyed by document ID
+_DOC_CONTENT = {
+    "main_system_prompt": "Base system instruction text",
+    "persona_catalyst": "# Catalyst Persona\nThe strategic AI planner.",
+    "persona_forge": "# Forge Persona\nThe expert AI implementer."
+}
+
+_INITIAL_PROMPT = (
+    "You are an AI assistant in the KeystoneAI-Framework. "
+    "You can help users with a variety of tasks."
+)
+
+_FULL_CONTEXT = dict(_DOC_CONTENT)
+
+_PERSONA_DEFS = {
+    "catalyst": _DOC_CONTENT["persona_catalyst"],
+    "forge": _DOC_CONTENT["persona_forge"]
+}
+
+# The DCM instance and manager mocks serve the same data directly
+_DCM_INSTANCE_TEMPLATE = {
+    "get_document_content.side_effect": _DOC_CONTENT.get,
+    "get_initial_prompt_template.return_value": _INITIAL_PROMPT,
+    "get_full_initial_context.return_value": _FULL_CONTEXT,
+    "get_persona_definitions.return_value": _PERSONA_DEFS,
+}
+
+_DCM_MANAGER_TEMPLATE = {
+    "get_document_content.side_effect": _DOC_CONTENT.get,
+    "get_initial_prompt.return_value": _INITIAL_PROMPT,
+    "get_full_context.return_value": _FULL_CONTEXT,
+    "get_persona_definitions.return_value": _PERSONA_DEFS,
+}
+
+_TOOL_REQUEST_HANDLER_TEMPLATE = {
+    "format_tool_result_as_message.side_effect": _format_tool_result_as_message,
+}
+
+_ERROR_HANDLER_TEMPLATE = {
+    "handle_error.side_effect": _handle_error,
+}
+
+
+def _build_llm_adapter_template():
+    """Build the mock LLM adapter that mock_llm_adapter hands out copies of."""
     adapter = MockLLMAdapter(
         config={
             "model_name": "mock-llm",
@@ -182,6 +244,148 @@ def mock_llm_adapter():
     return adapter
 
 
+# Response table shared by all mock_llm_adapter copies
+_LLM_ADAPTER_TEMPLATE = _build_llm_adapter_template()
+
+
+def _freeze(value):
+    """Return a read-only copy of value, with dicts as mappings and lists as tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Return a modifiable deep copy of a value built by _freeze."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return copy.deepcopy(value)
+
+
+# Complete configuration shared by all tests, read-only at every level; use
+# mock_complete_config_mutable to get a copy that may be modified
+_COMPLETE_CONFIG = _freeze({
+    "llm_provider": "mock",
+    "context_definition_file": "/path/to/FRAMEWORK_CONTEXT.md",
+    "default_persona": "forge",
+    "llm_settings": {
+        "model_name": "mock-llm",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        "api_key_env_var": "MOCK_API_KEY",
+        "system_instruction_id": "main_system_prompt"
+    },
+    "teps_settings": {
+        "bash": {
+            "allowed_commands": ["ls", "echo", "cat"],
+            "max_execution_time": 30
+        },
+        "dry_run_enabled": True
+    },
+    "ui_settings": {
+        "prompt_prefix": "> ",
+        "output_formatting": "colorized"
+    },
+    "message_history_settings": {
+        "max_length": 100,
+        "pruning_strategy": "remove_oldest",
+        "prioritize_system_messages": True
+    }
+})
+
+
+def _build_config_manager(config):
+    """Build a mock ConfigurationManager serving the given configuration."""
+    mock_manager = MagicMock(name="ConfigurationManager")
+    
+    # Set the config attribute
+    mock_manager.config = config
+    
+    # Configure getter methods
+    mock_manager.get_context_definition_path.return_value = config["context_definition_file"]
+    mock_manager.get_llm_provider.return_value = config["llm_provider"]
+    mock_manager.get_llm_settings.return_value = config["llm_settings"]
+    mock_manager.get_teps_settings.return_value = config["teps_settings"]
+    mock_manager.get_message_history_settings.return_value = config["message_history_settings"]
+    mock_manager.get_ui_settings.return_value = config["ui_settings"]
+    mock_manager.get_framework_settings.return_value = (
+        {"default_persona": config["default_persona"]} if "default_persona" in config else {}
+    )
+    
+    return mock_manager
+
+
+# Component classes FrameworkController.initialize constructs
+_CONTROLLER_COMPONENT_CLASSES = (
+    "DCMManager",
+    "LIALManager",
+    "TEPSManager",
+    "MessageManager",
+    "UserInterfaceManager",
+    "ToolRequestHandler",
+)
+
+
+# Configuration fixtures
+
+@pytest.fixture(scope="session")
+def mock_minimal_config():
+    """Provide a minimal valid configuration (shared, treat as read-only)."""
+    return {
+        "llm_provider": "mock",
+        "context_definition_file": "/path/to/FRAMEWORK_CONTEXT.md",
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_complete_config():
+    """Provide a complete configuration with all settings (read-only)."""
+    return _COMPLETE_CONFIG
+
+
+@pytest.fixture
+def mock_complete_config_mutable():
+    """Provide a private, modifiable copy of the complete configuration."""
+    return _thaw(_COMPLETE_CONFIG)
+
+
+@pytest.fixture
+def mock_io_capture(monkeypatch):
+    """Provide a MockIOCapture instance for testing UI interactions."""
+    io_capture = MockIOCapture()
+    io_capture.start_capture_via(monkeypatch)
+    io_capture.patch_input_via(monkeypatch)
+    
+    return io_capture
+
+
+# Component fixtures
+
+@pytest.fixture
+def mock_dcm_instance():
+    """Provide a mock DCM instance."""
+    return MagicMock(name="DynamicContextManager", **_DCM_INSTANCE_TEMPLATE)
+
+
+@pytest.fixture
+def mock_dcm_manager(mock_dcm_instance):
+    """Provide a mock DCMManager instance."""
+    mock_manager = MagicMock(name="DCMManager", **_DCM_MANAGER_TEMPLATE)
+    mock_manager.dcm_instance = mock_dcm_instance
+    
+    return mock_manager
+
+
+@pytest.fixture
+def mock_llm_adapter():
+    """Provide a mock LLM adapter instance."""
+    return copy.copy(_LLM_ADAPTER_TEMPLATE)
+
+
 @pytest.fixture
 def mock_lial_manager(mock_llm_adapter):
     """Provide a mock LIALManager instance."""
@@ -197,49 +401,7 @@ def mock_lial_manager(mock_llm_adapter):
 def mock_teps_instance():
     """Provide a mock TEPS instance."""
     mock_teps = MagicMock(name="TEPSEngine")
-    
-    # Configure execute_tool method with common behavior
-    def mock_execute_tool(tool_request):
-        tool_name = tool_request.get("tool_name", "unknown")
-        request_id = tool_request.get("request_id", "unknown")
-        
-        if tool_name == "readFile":
-            return {
-                "request_id": request_id,
-                "tool_name": tool_name,
-                "status": "success",
-                "data": "Content of the requested file."
-            }
-        elif tool_name == "writeFile":
-            return {
-                "request_id": request_id,
-                "tool_name": tool_name,
-                "status": "success",
-                "data": {"bytes_written": 123, "path": tool_request.get("parameters", {}).get("file_path")}
-            }
-        elif tool_name == "executeBashCommand":
-            return {
-                "request_id": request_id,
-                "tool_name": tool_name,
-                "status": "success",
-                "data": "Command output here"
-            }
-        elif "error" in tool_name.lower():
-            return {
-                "request_id": request_id,
-                "tool_name": tool_name,
-                "status": "error",
-                "data": {"error_message": "Tool execution failed"}
-            }
-        else:
-            return {
-                "request_id": request_id,
-                "tool_name": tool_name,
-                "status": "success",
-                "data": {"message": "Tool executed successfully"}
-            }
-    
-    mock_teps.execute_tool.side_effect = mock_execute_tool
+    mock_teps.execute_tool.side_effect = _execute_tool
     
     return mock_teps
 
@@ -250,8 +412,8 @@ def mock_teps_manager(mock_teps_instance):
     mock_manager = MagicMock(name="TEPSManager")
     mock_manager.teps_instance = mock_teps_instance
     
-    # Configure manager's execute_tool to delegate to teps_instance
-    mock_manager.execute_tool.side_effect = mock_teps_instance.execute_tool
+    # Serve tool results directly rather than through teps_instance's mock
+    mock_manager.execute_tool.side_effect = _execute_tool
     
     return mock_manager
 
@@ -264,39 +426,32 @@ def mock_message_manager():
     # Initialize with empty message list
     mock_manager.messages = []
     
-    # Track added messages for verification
-    mock_manager.added_messages = {
-        "system": [],
-        "user": [],
-        "assistant": [],
-        "tool_result": []
-    }
+    # get_messages results are cached until the history changes, which bumps
+    # the version
+    mock_manager._version = 0
+    mock_manager._cache = {}
     
-    # Configure add_*_message methods to update both messages list and tracking dict
+    # Configure add_*_message methods to update the messages list
     def add_system_message(content):
-        message = {"role": "system", "content": content}
-        mock_manager.messages.append(message)
-        mock_manager.added_messages["system"].append(message)
+        mock_manager.messages.append({"role": "system", "content": content})
+        mock_manager._version += 1
     
     def add_user_message(content):
-        message = {"role": "user", "content": content}
-        mock_manager.messages.append(message)
-        mock_manager.added_messages["user"].append(message)
+        mock_manager.messages.append({"role": "user", "content": content})
+        mock_manager._version += 1
     
     def add_assistant_message(content):
-        message = {"role": "assistant", "content": content}
-        mock_manager.messages.append(message)
-        mock_manager.added_messages["assistant"].append(message)
+        mock_manager.messages.append({"role": "assistant", "content": content})
+        mock_manager._version += 1
     
     def add_tool_result_message(tool_name, content, tool_call_id):
-        message = {
+        mock_manager.messages.append({
             "role": "tool_result",
             "content": content,
             "tool_name": tool_name,
             "tool_call_id": tool_call_id
-        }
-        mock_manager.messages.append(message)
-        mock_manager.added_messages["tool_result"].append(message)
+        })
+        mock_manager._version += 1
     
     mock_manager.add_system_message.side_effect = add_system_message
     mock_manager.add_user_message.side_effect = add_user_message
@@ -304,49 +459,56 @@ def mock_message_manager():
     mock_manager.add_tool_result_message.side_effect = add_tool_result_message
     
     # Configure get_messages to return a formatted copy
-    def get_messages(include_roles=None, exclude_roles=None, for_llm=False):
-        messages = mock_manager.messages.copy()
-        
-        if include_roles:
-            messages = [m for m in messages if m.get("role") in include_roles]
+    def build_messages(include_roles, exclude_roles, for_llm):
+        include_set = frozenset(include_roles) if include_roles else None
+        exclude_set = frozenset(exclude_roles) if exclude_roles else None
         
-        if exclude_roles:
-            messages = [m for m in messages if m.get("role") not in exclude_roles]
-        
-        if for_llm:
-            # Transform tool_result messages for LLM format
-            formatted = []
-            for msg in messages:
-                if msg.get("role") == "tool_result":
-                    formatted.append({
-                        "role": "tool",
-                        "content": msg.get("content"),
-                        "name": msg.get("tool_name"),
-                        "tool_call_id": msg.get("tool_call_id")
-                    })
-                else:
-                    # Copy standard messages
-                    formatted.append({
-                        "role": msg.get("role"),
-                        "content": msg.get("content")
-                    })
-            return formatted
+        # Filter and, for the LLM, transform the messages in a single pass
+        messages = []
+        append = messages.append
+        for msg in mock_manager.messages:
+            role = msg.get("role")
+            if include_set is not None and role not in include_set:
+                continue
+            if exclude_set is not None and role in exclude_set:
+                continue
+            
+            if not for_llm:
+                append(msg)
+            elif role == "tool_result":
+                # Transform tool_result messages for LLM format
+                append({
+                    "role": "tool",
+                    "content": msg.get("content"),
+                    "name": msg.get("tool_name"),
+                    "tool_call_id": msg.get("tool_call_id")
+                })
+            else:
+                # Copy standard messages
+                append({
+                    "role": role,
+                    "content": msg.get("content")
+                })
         
         return messages
     
+    def get_messages(include_roles=None, exclude_roles=None, for_llm=False):
+        key = (tuple(include_roles or ()), tuple(exclude_roles or ()), for_llm)
+        cached = mock_manager._cache.get(key)
+        if cached is None or cached[0] != mock_manager._version:
+            cached = (mock_manager._version, build_messages(include_roles, exclude_roles, for_llm))
+            mock_manager._cache[key] = cached
+        return list(cached[1])
+    
     mock_manager.get_messages.side_effect = get_messages
     
     # Configure clear_history
     def clear_history(preserve_system=True):
         if preserve_system:
             mock_manager.messages = [m for m in mock_manager.messages if m.get("role") == "system"]
-            mock_manager.added_messages["user"] = []
-            mock_manager.added_messages["assistant"] = []
-            mock_manager.added_messages["tool_result"] = []
         else:
             mock_manager.messages = []
-            for key in mock_manager.added_messages:
-                mock_manager.added_messages[key] = []
+        mock_manager._version += 1
     
     mock_manager.clear_history.side_effect = clear_history
     
@@ -356,35 +518,38 @@ def mock_message_manager():
 @pytest.fixture
 def mock_ui_manager(mock_io_capture):
     """Provide a mock UIManager instance."""
-    mock_manager = MagicMock(name="UserInterfaceManager")
+    mock_manager = Mock(name="UserInterfaceManager")
     
-    # Configure methods to use MockIOCapture
+    # Configure methods to use MockIOCapture; output is only produced when a
+    # test sets mock_io_capture.capture_enabled
     def display_system_message(message):
-        print(f"[SYSTEM] {message}")
+        if mock_io_capture.capture_enabled:
+            print(f"[SYSTEM] {message}")
     
     def display_user_message(message):
-        print(f"[USER] {message}")
+        if mock_io_capture.capture_enabled:
+            print(f"[USER] {message}")
     
     def display_assistant_message(message):
-        print(f"[ASSISTANT] {message}")
+        if mock_io_capture.capture_enabled:
+            print(f"[ASSISTANT] {message}")
     
     def display_error_message(error_type, message):
-        print(f"[ERROR:{error_type}] {message}")
+        if mock_io_capture.capture_enabled:
+            print(f"[ERROR:{error_type}] {message}")
     
     def display_special_command_help(commands):
-        print("[HELP] Available commands:")
-        for cmd, desc in commands.items():
-            print(f"  {cmd}: {desc}")
-    
-    def get_user_input():
-        return mock_io_capture.mock_input("[INPUT] ")
+        if mock_io_capture.capture_enabled:
+            print("[HELP] Available commands:")
+            for cmd, desc in commands.items():
+                print(f"  {cmd}: {desc}")
     
     mock_manager.display_system_message.side_effect = display_system_message
     mock_manager.display_user_message.side_effect = display_user_message
     mock_manager.display_assistant_message.side_effect = display_assistant_message
     mock_manager.display_error_message.side_effect = display_error_message
     mock_manager.display_special_command_help.side_effect = display_special_command_help
-    mock_manager.get_user_input.side_effect = get_user_input
+    mock_manager.get_user_input.side_effect = functools.partial(mock_io_capture.mock_input, "[INPUT] ")
     
     return mock_manager
 
@@ -392,37 +557,14 @@ def mock_ui_manager(mock_io_capture):
 @pytest.fixture
 def mock_tool_request_handler(mock_teps_manager):
     """Provide a mock ToolRequestHandler instance."""
-    mock_handler = MagicMock(name="ToolRequestHandler")
-    
-    # Configure process_tool_request to delegate to teps_manager
-    mock_handler.process_tool_request.side_effect = lambda tool_request: (
-        mock_teps_manager.execute_tool(tool_request)
+    mock_handler = Mock(
+        name="ToolRequestHandler",
+        spec_set=_TOOL_REQUEST_HANDLER_METHODS,
+        **_TOOL_REQUEST_HANDLER_TEMPLATE
     )
     
-    # Configure format_tool_result_as_message with common formatting
-    def format_tool_result_as_message(tool_result):
-        import json
-        
-        # Extract data
-        tool_name = tool_result.get("tool_name", "unknown")
-        request_id = tool_result.get("request_id", "unknown")
-        content = tool_result.get("data", {})
-        
-        # Format content as string if needed
-        if not isinstance(content, str):
-            try:
-                content = json.dumps(content)
-            except:
-                content = str(content)
-        
-        return {
-            "role": "tool_result",
-            "content": content,
-            "tool_name": tool_name,
-            "tool_call_id": request_id
-        }
-    
-    mock_handler.format_tool_result_as_message.side_effect = format_tool_result_as_message
+    # Configure process_tool_request to delegate to teps_manager
+    mock_handler.process_tool_request.side_effect = mock_teps_manager.execute_tool
     
     return mock_handler
 
@@ -430,85 +572,228 @@ def mock_tool_request_handler(mock_teps_manager):
 @pytest.fixture
 def mock_error_handler():
     """Provide a mock ErrorHandler instance."""
-    mock_handler = MagicMock(name="ErrorHandler")
+    return Mock(name="ErrorHandler", spec_set=_ERROR_HANDLER_METHODS, **_ERROR_HANDLER_TEMPLATE)
+
+
+@pytest.fixture
+def mock_config_manager(mock_complete_config):
+    """Provide a mock ConfigurationManager instance."""
+    return _build_config_manager(mock_complete_config)
+
+
+@pytest.fixture(scope="module")
+def mock_config_template():
+    """
+    Provide a ConfigurationManager mock with canned settings, built once per module.
+    
+    The instance is shared by every test in the module, so tests should only
+    read from it.
+    """
+    mock_config = MagicMock()
+    mock_config.get_context_definition_path.return_value = "/path/to/context.md"
+    mock_config.get_llm_provider.return_value = "mock_provider"
+    mock_config.get_llm_settings.return_value = {"model": "mock_model"}
+    mock_config.get_teps_settings.return_value = {"mock_setting": "value"}
+    mock_config.get_message_history_settings.return_value = {"max_length": 100}
+    mock_config.get_ui_settings.return_value = {"prompt_prefix": "> "}
+    mock_config.get_framework_settings.return_value = {"default_persona": "forge"}
+    mock_config.config = {
+        "default_persona": "forge"
+    }
+    return mock_config
+
+
+@pytest.fixture(scope="session")
+def controller_component_attributes():
+    """
+    Provide the attribute names of the controller's component classes.
+    
+    The classes are introspected once per session; controller_with_mocks
+    passes these lists as spec_set, so its mocks reject misspelled or renamed
+    methods without repeating the dir() walk for every mock.
+    """
+    from framework_core.component_managers.dcm_manager import DCMManager
+    from framework_core.component_managers.lial_manager import LIALManager
+    from framework_core.component_managers.teps_manager import TEPSManager
+    from framework_core.error_handler import ErrorHandler
+    from framework_core.message_manager import MessageManager
+    from framework_core.tool_request_handler import ToolRequestHandler
+    from framework_core.ui_manager import UserInterfaceManager
     
-    # Configure handle_error with common behavior
-    def handle_error(error_type, message, exception=None):
-        formatted_message = f"{error_type}: {message}"
-        if exception:
-            formatted_message += f" ({type(exception).__name__})"
-        return formatted_message
+    return {
+        "message_manager": dir(MessageManager),
+        "ui_manager": dir(UserInterfaceManager),
+        "lial_manager": dir(LIALManager),
+        "tool_request_handler": dir(ToolRequestHandler),
+        "error_handler": dir(ErrorHandler),
+        "dcm_manager": dir(DCMManager),
+        "teps_manager": dir(TEPSManager),
+    }
+
+
+@dataclass
+class ControllerMocks:
+    """The component mocks controller_with_mocks attaches to its controller."""
+    message_manager: MagicMock
+    ui_manager: MagicMock
+    lial_manager: MagicMock
+    tool_request_handler: MagicMock
+    error_handler: MagicMock
+
+
+@pytest.fixture
+def controller_with_mocks(mock_config_template, controller_component_attributes):
+    """
+    Provide a (FrameworkController, ControllerMocks) pair.
+    
+    The controller uses the module's shared config template and has fresh
+    message, UI, LIAL, tool request handler and error handler mocks attached,
+    each restricted to its component class's attributes. Its active persona is
+    resolved once from the framework settings, as _setup_initial_context does.
+    """
+    from framework_core.controller import FrameworkController
+    
+    attrs = controller_component_attributes
+    mocks = ControllerMocks(
+        message_manager=MagicMock(spec_set=attrs["message_manager"]),
+        ui_manager=MagicMock(spec_set=attrs["ui_manager"]),
+        lial_manager=MagicMock(spec_set=attrs["lial_manager"]),
+        tool_request_handler=MagicMock(spec_set=attrs["tool_request_handler"]),
+        error_handler=MagicMock(spec_set=attrs["error_handler"]),
+    )
     
-    mock_handler.handle_error.side_effect = handle_error
+    controller = FrameworkController(mock_config_template)
+    controller.active_persona_id = mock_config_template.get_framework_settings()["default_persona"]
+    for name, mock in vars(mocks).items():
+        setattr(controller, name, mock)
     
-    return mock_handler
+    return controller, mocks
+
+
+@pytest.fixture(scope="module")
+def initialized_controller(mock_complete_config):
+    """
+    Provide a FrameworkController initialized once per test module.
+    
+    The component classes are patched during initialize(), so every
+    component is a MagicMock. Use the controller fixture, which gives each
+    test reset component mocks and restores the controller state afterwards.
+    """
+    from framework_core.controller import FrameworkController
+    
+    config_manager = _build_config_manager(mock_complete_config)
+    
+    controller = FrameworkController(config_manager)
+    controller.error_handler = MagicMock(name="ErrorHandler")
+    
+    component_classes = {name: MagicMock(name=name) for name in _CONTROLLER_COMPONENT_CLASSES}
+    with patch.multiple("framework_core.controller", **component_classes):
+        assert controller.initialize() is True
+    
+    return controller
+
+
+@pytest.fixture(scope="module")
+def controller_component_specs():
+    """
+    Provide autospecced mocks of the controller's components, built once per module.
+    
+    The controller fixture resets them between tests rather than rebuilding
+    them, since autospec construction is expensive.
+    """
+    from framework_core.component_managers.dcm_manager import DCMManager
+    from framework_core.component_managers.lial_manager import LIALManager
+    from framework_core.component_managers.teps_manager import TEPSManager
+    from framework_core.error_handler import ErrorHandler
+    from framework_core.message_manager import MessageManager
+    from framework_core.tool_request_handler import ToolRequestHandler
+    from framework_core.ui_manager import UserInterfaceManager
+    
+    return {
+        "dcm_manager": create_autospec(DCMManager, spec_set=True, instance=True),
+        "lial_manager": create_autospec(LIALManager, spec_set=True, instance=True),
+        "teps_manager": create_autospec(TEPSManager, spec_set=True, instance=True),
+        "message_manager": create_autospec(MessageManager, spec_set=True, instance=True),
+        "ui_manager": create_autospec(UserInterfaceManager, spec_set=True, instance=True),
+        "tool_request_handler": create_autospec(ToolRequestHandler, spec_set=True, instance=True),
+        "error_handler": create_autospec(ErrorHandler, spec_set=True, instance=True),
+    }
 
 
 @pytest.fixture
-def mock_config_manager(mock_complete_config):
-    """Provide a mock ConfigurationManager instance."""
-    mock_manager = MagicMock(name="ConfigurationManager")
+def controller(initialized_controller, controller_component_specs):
+    """Provide the module's initialized controller with reset component mocks."""
+    # Attributes the test rebinds, such as running and debug_mode, are
+    # restored afterwards
+    state = dict(vars(initialized_controller))
     
-    # Set the config attribute
-    mock_manager.config = mock_complete_config
+    # The autospecs define no magic methods, so resetting their return values
+    # is safe (unlike a plain MagicMock's __bool__)
+    for name, component in controller_component_specs.items():
+        component.reset_mock(return_value=True, side_effect=True)
+        setattr(initialized_controller, name, component)
+    initialized_controller.message_manager.get_messages.return_value = []
     
-    # Configure getter methods
-    mock_manager.get_context_definition_path.return_value = mock_complete_config["context_definition_file"]
-    mock_manager.get_llm_provider.return_value = mock_complete_config["llm_provider"]
-    mock_manager.get_llm_settings.return_value = mock_complete_config["llm_settings"]
-    mock_manager.get_teps_settings.return_value = mock_complete_config["teps_settings"]
-    mock_manager.get_message_history_settings.return_value = mock_complete_config["message_history_settings"]
-    mock_manager.get_ui_settings.return_value = mock_complete_config["ui_settings"]
+    yield initialized_controller
     
-    return mock_manager
+    vars(initialized_controller).clear()
+    vars(initialized_controller).update(state)
 
 
 # Faker component mocks
 
 @pytest.fixture
-def framework_controller_factory(
-    mock_config_manager,
-    mock_dcm_manager,
-    mock_lial_manager,
-    mock_teps_manager,
-    mock_message_manager,
-    mock_ui_manager,
-    mock_tool_request_handler,
-    mock_error_handler
-):
-    """Factory function to create a fresh FrameworkController instance with mock components."""
-    def create_controller():
+def framework_controller_factory(request):
+    """
+    Factory function to create a fresh FrameworkController instance with mock components.
+    
+    Components can be supplied as keyword arguments (e.g. ``config_manager=...``);
+    mock fixtures are only set up for the components that are not supplied.
+    """
+    def create_controller(**overrides):
         from framework_core.controller import FrameworkController
         
+        def component(name):
+            if name in overrides:
+                return overrides[name]
+            return request.getfixturevalue(f"mock_{name}")
+        
         # Create a new controller with the mock config manager
-        controller = FrameworkController(mock_config_manager)
+        controller = FrameworkController(component("config_manager"))
         
         # Replace error handler
-        controller.error_handler = mock_error_handler
+        controller.error_handler = component("error_handler")
         
         # Replace components
-        controller.dcm_manager = mock_dcm_manager
-        controller.lial_manager = mock_lial_manager
-        controller.teps_manager = mock_teps_manager
-        controller.message_manager = mock_message_manager
-        controller.ui_manager = mock_ui_manager
-        controller.tool_request_handler = mock_tool_request_handler
+        controller.dcm_manager = component("dcm_manager")
+        controller.lial_manager = component("lial_manager")
+        controller.teps_manager = component("teps_manager")
+        controller.message_manager = component("message_manager")
+        controller.ui_manager = component("ui_manager")
+        controller.tool_request_handler = component("tool_request_handler")
         
         return controller
     
     return create_controller
 
 
+# Directories and files created in the fake filesystem for TEPS tests
+_FAKE_DIRS = ('/home/user', '/tmp', '/path/to')
+
+_FAKE_FILES = (
+    ('/path/to/file.txt', 'This is a test file.'),
+    ('/path/to/config.yaml', 'key: value\nlist:\n  - item1\n  - item2'),
+)
+
+
 @pytest.fixture
 def pyfakefs_for_teps(fs):
     """Set up a fake filesystem for TEPS testing."""
     # Create common test directories and files
-    fs.create_dir('/home/user')
-    fs.create_dir('/tmp')
-    fs.create_dir('/path/to')
+    for path in _FAKE_DIRS:
+        fs.create_dir(path)
     
-    # Create test files
-    fs.create_file('/path/to/file.txt', contents='This is a test file.')
-    fs.create_file('/path/to/config.yaml', contents='key: value\nlist:\n  - item1\n  - item2')
+    for path, contents in _FAKE_FILES:
+        fs.create_file(path, contents=contents)
     
-    return fs
\ No newline at end of file
+    return fs
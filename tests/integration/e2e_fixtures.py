@@ -9,46 +9,54 @@ for end-to-end testing of the KeystoneAI-Framework, including:
 - Test data management
 """
 
-import os
-import sys
+import functools
+import itertools
 import pytest
 import json
-import uuid
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Callable, Union, Tuple
-from unittest.mock import MagicMock, patch
-
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from framework_core.exceptions import (
-    ConfigError, 
-    DCMInitError, 
-    LIALInitError, 
-    TEPSInitError,
-    ComponentInitError,
-    ToolExecutionError
-)
-from framework_core.lial_core import Message, LLMResponse, ToolRequest, ToolResult
-
-from tests.integration.utils import MockLLMAdapter, ResponseBuilder, MockIOCapture, IntegrationTestCase
-from tests.integration.conftest import (
-    mock_minimal_config,
-    mock_complete_config,
-    mock_io_capture,
-    mock_dcm_instance,
-    mock_dcm_manager,
-    mock_llm_adapter,
-    mock_lial_manager,
-    mock_teps_instance,
-    mock_teps_manager,
-    mock_message_manager,
-    mock_ui_manager,
-    mock_tool_request_handler,
-    mock_error_handler,
-    framework_controller_factory
-)
+from unittest.mock import MagicMock
+
+from tests.integration.utils import MockLLMAdapter, initialize_with_mocks
+
+
+# Sequential, reproducible IDs for the tool requests in predefined scenarios
+_request_ids = itertools.count()
+
+
+# Data of the fallback result for tool requests without a scenario result
+_DEFAULT_TOOL_DATA = "Default response for {}"
+
+
+def _default_tool_result(tool_request: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    """Build the fallback result for a tool request the scenario has no result for."""
+    tool_name = tool_request.get("tool_name", "unknown")
+    return {
+        "request_id": request_id,
+        "tool_name": tool_name,
+        "status": "success",
+        "data": _DEFAULT_TOOL_DATA.format(tool_name)
+    }
+
+
+class _ToolDispatcher:
+    """Mock execute_tool returning scenario tool results by request ID."""
+    
+    __slots__ = ("_results",)
+    
+    def __init__(self, results: Dict[str, Dict[str, Any]]):
+        self._results = results
+    
+    def __call__(self, tool_request: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = tool_request.get("request_id", "unknown")
+        result = self._results.get(request_id)
+        if result is not None:
+            return result
+        return _default_tool_result(tool_request, request_id)
 
 
+@dataclass
 class ConversationScenario:
     """
     Utility class for defining and executing conversation scenarios.
@@ -57,22 +65,15 @@ class ConversationScenario:
     a sequence of user inputs, expected LLM responses, and verification steps.
     """
     
-    def __init__(self, 
-                 name: str,
-                 description: str = ""):
-        """
-        Initialize a conversation scenario.
-        
-        Args:
-            name: Name of the scenario
-            description: Description of what the scenario tests
-        """
-        self.name = name
-        self.description = description
-        self.user_inputs = []
-        self.expected_llm_responses = []
-        self.tool_results = {}
-        self.verification_steps = []
+    name: str
+    description: str = ""
+    user_inputs: List[str] = field(default_factory=list)
+    expected_llm_responses: List[Dict[str, Any]] = field(default_factory=list)
+    tool_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    verification_steps: List[Tuple[Callable[[Any], None], str]] = field(default_factory=list)
+    
+    # Derived data, built on first use and dropped when the inputs change
+    _scripted_inputs: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
     
     def add_user_input(self, user_input: str) -> 'ConversationScenario':
         """
@@ -85,6 +86,7 @@ class ConversationScenario:
             Self for chaining
         """
         self.user_inputs.append(user_input)
+        self._scripted_inputs = None
         return self
     
     def add_expected_llm_response(self, 
@@ -148,6 +150,31 @@ class ConversationScenario:
         self.verification_steps.append((verification_func, step_description))
         return self
     
+    def freeze(self) -> 'ConversationScenario':
+        """
+        Convert the inputs, responses and verification steps to tuples.
+        
+        A frozen scenario can no longer be extended with the add_* methods
+        (tool results excepted) and is safe to share between tests.
+        
+        Returns:
+            Self for chaining
+        """
+        self.user_inputs = tuple(self.user_inputs)
+        self.expected_llm_responses = tuple(self.expected_llm_responses)
+        self.verification_steps = tuple(self.verification_steps)
+        
+        # The derived data can no longer change, so build it now
+        self._scripted_inputs = (*self.user_inputs, "/quit")
+        return self
+    
+    @property
+    def scripted_inputs(self) -> Tuple[str, ...]:
+        """The user inputs followed by a final /quit to end the conversation."""
+        if self._scripted_inputs is None:
+            self._scripted_inputs = (*self.user_inputs, "/quit")
+        return self._scripted_inputs
+    
     def configure_mock_llm(self, mock_llm: MockLLMAdapter) -> None:
         """
         Configure the mock LLM with expected responses for this scenario.
@@ -158,40 +185,17 @@ class ConversationScenario:
         # Clear any previous configuration
         mock_llm.clear_configurations()
         
-        # Configure responses for each step
-        for i, response in enumerate(self.expected_llm_responses):
-            response_key = f"{self.name}_step_{i}"
-            mock_llm.configure_response(response_key, response)
-            
-            # If this is a user input triggered response, add pattern
-            if i < len(self.user_inputs):
-                user_input = self.user_inputs[i]
-                mock_llm.configure_pattern(user_input[:20], response_key)
+        # Each response answers the next user input or tool result in turn
+        mock_llm.script_responses(self.expected_llm_responses)
     
     def configure_mock_teps(self, mock_teps: MagicMock) -> None:
         """
         Configure the mock TEPS with expected tool results for this scenario.
         
         Args:
-            mock_teps: The mock TEPS instance to configure
+            mock_teps: The mock TEPS instance or manager to configure
         """
-        # Create a side effect function for execute_tool
-        def execute_tool_side_effect(tool_request):
-            request_id = tool_request.get("request_id", "unknown")
-            if request_id in self.tool_results:
-                return self.tool_results[request_id]
-            else:
-                # Default fallback response
-                tool_name = tool_request.get("tool_name", "unknown")
-                return {
-                    "request_id": request_id,
-                    "tool_name": tool_name,
-                    "status": "success",
-                    "data": f"Default response for {tool_name}"
-                }
-        
-        # Set the side effect
-        mock_teps.execute_tool.side_effect = execute_tool_side_effect
+        mock_teps.execute_tool.side_effect = _ToolDispatcher(self.tool_results)
 
 
 class MockScenarioBuilder:
@@ -199,10 +203,14 @@ class MockScenarioBuilder:
     Utility for building mock scenarios for end-to-end testing.
     
     This class provides methods for creating realistic mock data
-    and predefined scenarios for common testing patterns.
+    and predefined scenarios for common testing patterns. Each predefined
+    scenario is built once, frozen and shared between tests.
     """
     
+    __slots__ = ()
+    
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_basic_conversation() -> ConversationScenario:
         """
         Create a basic conversation scenario without tool usage.
@@ -224,11 +232,12 @@ class MockScenarioBuilder:
             "I can answer questions, assist with code, read and write files, and execute commands. "
             "I can also help explain the framework architecture and components."
         ).add_verification_step(
-            lambda controller: assert_message_count(controller, 4),
+            lambda controller: assert_message_count(controller, 5),  # System + 2 x (User + Assistant)
             "Verify message count is correct"
-        )
+        ).freeze()
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_tool_usage_scenario() -> ConversationScenario:
         """
         Create a scenario involving tool usage.
@@ -236,7 +245,7 @@ class MockScenarioBuilder:
         Returns:
             ConversationScenario configured for tool usage
         """
-        read_file_request_id = f"read-{str(uuid.uuid4())[:8]}"
+        read_file_request_id = f"read-{next(_request_ids):08x}"
         return ConversationScenario(
             name="tool_usage",
             description="Conversation with tool usage"
@@ -258,9 +267,10 @@ class MockScenarioBuilder:
         ).add_verification_step(
             lambda controller: assert_tool_was_executed(controller, "readFile"),
             "Verify readFile tool was executed"
-        )
+        ).freeze()
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_command_scenario() -> ConversationScenario:
         """
         Create a scenario involving special command usage.
@@ -282,9 +292,10 @@ class MockScenarioBuilder:
         ).add_verification_step(
             lambda controller: assert_system_message_added(controller, "You are a helpful assistant that specializes in Python programming."),
             "Verify system message was added"
-        )
+        ).freeze()
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def create_error_scenario() -> ConversationScenario:
         """
         Create a scenario involving error handling.
@@ -292,7 +303,7 @@ class MockScenarioBuilder:
         Returns:
             ConversationScenario configured for error handling
         """
-        error_tool_request_id = f"error-{str(uuid.uuid4())[:8]}"
+        error_tool_request_id = f"error-{next(_request_ids):08x}"
         return ConversationScenario(
             name="error_handling",
             description="Handling of tool execution errors"
@@ -313,9 +324,9 @@ class MockScenarioBuilder:
         ).add_expected_llm_response(
             "I encountered an error trying to run that command. The command 'invalid_command' was not found on the system."
         ).add_verification_step(
-            lambda controller: assert_error_handled(controller, "Command not found"),
-            "Verify error was properly handled"
-        )
+            lambda controller: assert_tool_result_added(controller, "Command not found"),
+            "Verify the tool error was passed back to the LLM"
+        ).freeze()
 
 
 # Verification utility functions
@@ -325,47 +336,110 @@ def assert_message_count(controller, expected_count):
     actual_count = len(controller.message_manager.messages)
     assert actual_count == expected_count, f"Expected {expected_count} messages, got {actual_count}"
 
+def _call_arg(call, name):
+    """Return the first positional argument of a recorded call, or the named keyword."""
+    args, kwargs = call
+    return args[0] if args else kwargs.get(name)
+
 def assert_tool_was_executed(controller, tool_name):
     """Assert that a specific tool was executed."""
     for call in controller.tool_request_handler.process_tool_request.call_args_list:
-        args, kwargs = call
-        tool_request = args[0] if args else kwargs.get("tool_request")
+        tool_request = _call_arg(call, "tool_request")
         if tool_request and tool_request.get("tool_name") == tool_name:
-            return True
+            return
     assert False, f"Tool '{tool_name}' was not executed"
 
 def assert_system_message_added(controller, message_content):
     """Assert that a specific system message was added."""
     for call in controller.message_manager.add_system_message.call_args_list:
-        args, kwargs = call
-        content = args[0] if args else kwargs.get("content")
-        if content == message_content:
-            return True
+        if _call_arg(call, "content") == message_content:
+            return
     assert False, f"System message '{message_content}' was not added"
 
+def assert_tool_result_added(controller, result_text):
+    """Assert that a tool result containing a specific text was added."""
+    for call in controller.message_manager.add_tool_result_message.call_args_list:
+        if result_text in str(_call_arg(call, "content")):
+            return
+    assert False, f"Tool result containing '{result_text}' was not added"
+
 def assert_error_handled(controller, error_text):
     """Assert that a specific error was handled."""
     for call in controller.error_handler.handle_error.call_args_list:
         args, kwargs = call
-        if any(error_text in str(arg) for arg in args):
-            return True
-        if any(error_text in str(value) for value in kwargs.values()):
-            return True
+        for value in (*args, *kwargs.values()):
+            if isinstance(value, str):
+                if error_text in value:
+                    return
+            elif error_text in str(value):
+                return
     assert False, f"Error containing '{error_text}' was not handled"
 
 
+# Test data shared by all end-to-end tests
+
+# Paths to test data files
+_E2E_TEST_PATHS = MappingProxyType({
+    "python_file": "/path/to/example.py",
+    "text_file": "/path/to/example.txt",
+    "json_file": "/path/to/example.json",
+    "project_dir": "/path/to/project"
+})
+
+# Content of test files
+_E2E_TEST_CONTENTS = MappingProxyType({
+    "/path/to/example.py": "def hello_world():\n    print('Hello, world!')\n\nif __name__ == '__main__':\n    hello_world()",
+    "/path/to/example.txt": "This is a sample text file for testing purposes.",
+    "/path/to/example.json": json.dumps({"name": "Test Object", "values": [1, 2, 3], "active": True}, indent=2)
+})
+
+_E2E_TEST_DATA = MappingProxyType({
+    "paths": _E2E_TEST_PATHS,
+    "contents": _E2E_TEST_CONTENTS
+})
+
+# Directories and encoded files created in the fake filesystem
+_E2E_FS_DIRS = ('/path/to', '/path/to/project')
+
+_E2E_FS_SNAPSHOT = tuple(
+    (file_path, content.encode("utf-8"))
+    for file_path, content in _E2E_TEST_CONTENTS.items()
+)
+
+
 # Pytest fixtures
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario_builder():
-    """Provide a ScenarioBuilder instance for end-to-end tests."""
-    return MockScenarioBuilder()
+    """Provide the scenario builder for end-to-end tests."""
+    # Every builder method is a static method, so the class serves directly
+    return MockScenarioBuilder
+
+@pytest.fixture(scope="session")
+def basic_scenario():
+    """Provide the predefined basic conversation scenario."""
+    return MockScenarioBuilder.create_basic_conversation()
+
+@pytest.fixture(scope="session")
+def tool_scenario():
+    """Provide the predefined tool usage scenario."""
+    return MockScenarioBuilder.create_tool_usage_scenario()
+
+@pytest.fixture(scope="session")
+def command_scenario():
+    """Provide the predefined special command scenario."""
+    return MockScenarioBuilder.create_command_scenario()
+
+@pytest.fixture(scope="session")
+def error_scenario():
+    """Provide the predefined error handling scenario."""
+    return MockScenarioBuilder.create_error_scenario()
 
 @pytest.fixture
 def e2e_controller(framework_controller_factory):
     """Provide a pre-initialized controller for end-to-end tests."""
     controller = framework_controller_factory()
-    controller.initialize()
+    assert initialize_with_mocks(controller) is True
     return controller
 
 @pytest.fixture
@@ -376,52 +450,29 @@ def mock_conversation(mock_io_capture, mock_llm_adapter):
         scenario.configure_mock_llm(mock_llm_adapter)
         
         # Configure TEPS with scenario tool results
-        scenario.configure_mock_teps(controller.teps_manager.teps_instance)
+        scenario.configure_mock_teps(controller.teps_manager)
         
-        # Add user inputs to the input queue
+        # Queue the user inputs, ending with /quit
         mock_io_capture.clear_inputs()
-        for user_input in scenario.user_inputs:
-            mock_io_capture.add_input(user_input)
-        
-        # Add a final /quit to end the conversation
-        mock_io_capture.add_input("/quit")
+        mock_io_capture.extend_inputs(scenario.scripted_inputs)
         
         return controller
     
     return setup_conversation
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def e2e_test_data():
-    """Provide test data for end-to-end tests."""
-    # Paths to test data files
-    test_data = {
-        "python_file": "/path/to/example.py",
-        "text_file": "/path/to/example.txt",
-        "json_file": "/path/to/example.json",
-        "project_dir": "/path/to/project"
-    }
-    
-    # Content of test files
-    test_file_contents = {
-        "/path/to/example.py": "def hello_world():\n    print('Hello, world!')\n\nif __name__ == '__main__':\n    hello_world()",
-        "/path/to/example.txt": "This is a sample text file for testing purposes.",
-        "/path/to/example.json": json.dumps({"name": "Test Object", "values": [1, 2, 3], "active": True}, indent=2)
-    }
-    
-    return {
-        "paths": test_data,
-        "contents": test_file_contents
-    }
+    """Provide read-only test data for end-to-end tests."""
+    return _E2E_TEST_DATA
 
-@pytest.fixture
-def setup_pyfakefs_for_e2e(fs, e2e_test_data):
-    """Set up a fake filesystem for end-to-end tests."""
-    # Create directories
-    fs.create_dir('/path/to')
-    fs.create_dir('/path/to/project')
+@pytest.fixture(scope="module")
+def setup_pyfakefs_for_e2e(fs_module):
+    """Set up a fake filesystem shared by the end-to-end tests of a module."""
+    for dir_path in _E2E_FS_DIRS:
+        fs_module.create_dir(dir_path)
     
     # Create files with test content
-    for file_path, content in e2e_test_data["contents"].items():
-        fs.create_file(file_path, contents=content)
+    for file_path, blob in _E2E_FS_SNAPSHOT:
+        fs_module.create_file(file_path, contents=blob)
     
-    return fs
\ No newline at end of file
+    return fs_module
\ No newline at end of file
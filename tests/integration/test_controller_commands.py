@@ -5,72 +5,108 @@ These tests verify that the Framework Controller correctly processes special com
 """
 
 import pytest
-import os
-import sys
-from unittest.mock import MagicMock, patch, call
-
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from unittest.mock import MagicMock, create_autospec, patch, call
 
+from framework_core.component_managers.lial_manager import LIALManager
+from framework_core.config_loader import ConfigurationManager
 from framework_core.controller import FrameworkController
+from framework_core.message_manager import MessageManager
+from framework_core.ui_manager import UserInterfaceManager
+
+
+@pytest.fixture(scope="session")
+def _prebuilt_mock_template():
+    """Build autospecced config, message, UI and LIAL manager mocks once per session."""
+    return (
+        create_autospec(ConfigurationManager, spec_set=True, instance=True),
+        create_autospec(MessageManager, spec_set=True, instance=True),
+        create_autospec(UserInterfaceManager, spec_set=True, instance=True),
+        create_autospec(LIALManager, spec_set=True, instance=True),
+    )
+
+
+@pytest.fixture
+def command_controller(_prebuilt_mock_template):
+    """Provide a FrameworkController wired to the reset session mocks."""
+    # The autospecs define no magic methods, so return values can be reset too
+    for mock in _prebuilt_mock_template:
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_config, message_manager, ui_manager, lial_manager = _prebuilt_mock_template
+    
+    # Create controller with mock config
+    controller = FrameworkController(mock_config)
+    
+    # Attach mocks for required components
+    controller.message_manager = message_manager
+    controller.ui_manager = ui_manager
+    controller.lial_manager = lial_manager
+    
+    # Set running flag to true (normally set by initialize)
+    controller.running = True
+    
+    return controller
+
+
+def _assert_help(controller):
+    controller.ui_manager.display_special_command_help.assert_called_once_with(
+        controller.SPECIAL_COMMANDS
+    )
+
+
+def _assert_clear(controller):
+    controller.message_manager.clear_history.assert_called_once_with(preserve_system=True)
+    controller.ui_manager.display_system_message.assert_any_call("Conversation history cleared.")
+
+
+def _assert_system(controller):
+    controller.message_manager.add_system_message.assert_called_with("New system message")
+    controller.ui_manager.display_system_message.assert_any_call("Added system message: New system message")
+
+
+def _assert_debug(controller):
+    assert controller.debug_mode is True
+    controller.ui_manager.display_system_message.assert_any_call("Debug mode enabled.")
+
+
+def _assert_unknown(controller):
+    controller.ui_manager.display_error_message.assert_called_once_with(
+        "Command Error", "Unknown command: /unknown"
+    )
+
 
 class TestControllerCommands:
     """
     Integration tests for Framework Controller command processing.
     """
     
-    def test_help_command_processing(self):
-        """Test processing of the /help special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
-        
-        # Configure UI manager to return /help and then /quit
-        controller.ui_manager.get_user_input.side_effect = ["/help", "/quit"]
-        
-        # Configure LLM response to avoid errors
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
-        
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
-        # Run the controller
-        controller.run()
-        
-        # Verify help command was processed
-        controller.ui_manager.display_special_command_help.assert_called_once_with(
-            controller.SPECIAL_COMMANDS
-        )
+    @pytest.mark.parametrize(
+        "user_input,assert_fn",
+        [
+            ("/help", _assert_help),
+            ("/clear", _assert_clear),
+            ("/system New system message", _assert_system),
+            ("/debug", _assert_debug),
+            ("/unknown", _assert_unknown),
+        ],
+        ids=["help", "clear", "system", "debug", "unknown"],
+    )
+    def test_command_processing(self, command_controller, user_input, assert_fn):
+        """Test processing of each special command other than /quit."""
+        controller = command_controller
+        
+        # Dispatch the command to the command handler
+        assert controller._process_special_command(user_input) is True
+        
+        # Verify the command was processed
+        assert_fn(controller)
     
-    def test_quit_command_processing(self):
+    def test_quit_command_processing(self, command_controller):
         """Test processing of the /quit special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
+        controller = command_controller
         
         # Configure UI manager to return /quit
         controller.ui_manager.get_user_input.return_value = "/quit"
         
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
         # Run the controller
         controller.run()
         
@@ -78,132 +114,3 @@ class TestControllerCommands:
         assert controller.running is False
         controller.ui_manager.display_system_message.assert_any_call("Exiting application...")
         controller.ui_manager.display_system_message.assert_any_call("Framework shutdown complete. Goodbye!")
-    
-    def test_clear_command_processing(self):
-        """Test processing of the /clear special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
-        
-        # Configure UI manager to return /clear and then /quit
-        controller.ui_manager.get_user_input.side_effect = ["/clear", "/quit"]
-        
-        # Configure LLM response to avoid errors
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
-        
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
-        # Run the controller
-        controller.run()
-        
-        # Verify clear command was processed
-        controller.message_manager.clear_history.assert_called_once_with(preserve_system=True)
-        controller.ui_manager.display_system_message.assert_any_call("Conversation history cleared.")
-    
-    def test_system_command_processing(self):
-        """Test processing of the /system special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
-        
-        # Configure UI manager to return /system message and then /quit
-        controller.ui_manager.get_user_input.side_effect = ["/system New system message", "/quit"]
-        
-        # Configure LLM response to avoid errors
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
-        
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
-        # Run the controller
-        controller.run()
-        
-        # Verify system command was processed
-        controller.message_manager.add_system_message.assert_called_with("New system message")
-        controller.ui_manager.display_system_message.assert_any_call("Added system message: New system message")
-    
-    def test_debug_command_processing(self):
-        """Test processing of the /debug special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
-        
-        # Configure UI manager to return /debug and then /quit
-        controller.ui_manager.get_user_input.side_effect = ["/debug", "/quit"]
-        
-        # Configure LLM response to avoid errors
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
-        
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
-        # Run the controller
-        controller.run()
-        
-        # Verify debug command was processed
-        assert controller.debug_mode is True
-        controller.ui_manager.display_system_message.assert_any_call("Debug mode enabled.")
-    
-    def test_unknown_command_processing(self):
-        """Test processing of an unknown special command."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.lial_manager = MagicMock(name="LIALManager")
-        
-        # Configure UI manager to return an unknown command and then /quit
-        controller.ui_manager.get_user_input.side_effect = ["/unknown", "/quit"]
-        
-        # Configure LLM response to avoid errors
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
-        
-        # Set running flag to true (normally set by initialize)
-        controller.running = True
-        
-        # Run the controller
-        controller.run()
-        
-        # Verify unknown command error is shown
-        controller.ui_manager.display_error_message.assert_called_once_with(
-            "Command Error", "Unknown command: /unknown"
-        )
\ No newline at end of file
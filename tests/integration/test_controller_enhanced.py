@@ -6,23 +6,86 @@ ensure comprehensive coverage of the controller's functionality.
 """
 
 import pytest
-import os
-import sys
-from unittest.mock import MagicMock, patch, call
-
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 from framework_core.controller import FrameworkController
-from framework_core.exceptions import (
-    ConfigError, 
-    DCMInitError, 
-    LIALInitError, 
-    TEPSInitError,
-    ComponentInitError,
-    ToolExecutionError
-)
-from tests.integration.utils import ResponseBuilder, IntegrationTestCase
+from tests.integration.utils import ResponseBuilder, IntegrationTestCase, initialize_with_mocks
+
+
+@pytest.fixture(scope="session")
+def _config_manager_autospec():
+    """Build the ConfigurationManager autospec once per session."""
+    from framework_core.config_loader import ConfigurationManager
+    return create_autospec(ConfigurationManager, instance=True)
+
+
+@pytest.fixture
+def config_manager_spec(_config_manager_autospec):
+    """Provide the cached ConfigurationManager autospec with its calls reset."""
+    _config_manager_autospec.reset_mock(return_value=True, side_effect=True)
+    return _config_manager_autospec
+
+
+# Canned payloads for the sequential tool request test. The controller only
+# reads them, so they are shared between runs. They must stay plain dicts, as
+# the controller only treats dict instances as a single tool request.
+_TOOL_REQ_1 = {
+    "request_id": "command-1",
+    "tool_name": "executeBashCommand",
+    "parameters": {"command": "ls"}
+}
+
+_TOOL_REQ_2 = {
+    "request_id": "command-2",
+    "tool_name": "executeBashCommand",
+    "parameters": {"command": "pwd"}
+}
+
+_TOOL_RESULT_1 = {
+    "request_id": "command-1",
+    "tool_name": "executeBashCommand",
+    "status": "success",
+    "data": "file1.txt file2.txt"
+}
+
+_TOOL_RESULT_2 = {
+    "request_id": "command-2",
+    "tool_name": "executeBashCommand",
+    "status": "success",
+    "data": "/home/user"
+}
+
+_TOOL_MSG_1 = {
+    "role": "tool_result",
+    "content": "file1.txt file2.txt",
+    "tool_name": "executeBashCommand",
+    "tool_call_id": "command-1"
+}
+
+_TOOL_MSG_2 = {
+    "role": "tool_result",
+    "content": "/home/user",
+    "tool_name": "executeBashCommand",
+    "tool_call_id": "command-2"
+}
+
+
+# Expected calls, in order
+_SEQUENTIAL_TOOL_CALLS = [
+    call(_TOOL_REQ_1),
+    call(_TOOL_REQ_2)
+]
+
+_SEQUENTIAL_ASSISTANT_CALLS = [
+    call("I'll run the first command."),
+    call("Now I'll run the second command."),
+    call("I've completed all commands.")
+]
+
+_LIFECYCLE_ASSISTANT_CALLS = [
+    call("I'll execute that command."),
+    call("The command has been executed successfully.")
+]
 
 
 class TestControllerPersonaAndConfig(IntegrationTestCase):
@@ -53,14 +116,14 @@ class TestControllerPersonaAndConfig(IntegrationTestCase):
         assert "active_persona_id" in call_args
         assert call_args["active_persona_id"] == "catalyst"
     
-    def test_default_persona_configuration(self, framework_controller_factory, mock_complete_config):
+    def test_default_persona_configuration(self, framework_controller_factory, mock_complete_config_mutable):
         """Test that the default persona is correctly loaded from configuration."""
         # Modify mock config to have a specific default persona
-        mock_complete_config["default_persona"] = "forge"
+        mock_complete_config_mutable["default_persona"] = "forge"
         
         # Create a controller instance with this config
         controller = framework_controller_factory()
-        controller.config_manager.config = mock_complete_config
+        controller.config_manager.config = mock_complete_config_mutable
         
         # Initialize the controller
         controller.initialize()
@@ -76,13 +139,10 @@ class TestControllerPersonaAndConfig(IntegrationTestCase):
         call_args = controller.lial_manager.send_messages.call_args[1]
         assert call_args["active_persona_id"] == "forge"
     
-    def test_configuration_loading(self, mock_complete_config):
+    def test_configuration_loading(self, mock_complete_config, config_manager_spec):
         """Test that the controller correctly loads and uses configuration settings."""
-        # Create a controller with the mock config
-        from framework_core.config_loader import ConfigurationManager
-        
         # Create a mock config manager that returns our mock config
-        mock_config_manager = MagicMock(spec=ConfigurationManager)
+        mock_config_manager = config_manager_spec
         mock_config_manager.config = mock_complete_config
         mock_config_manager.get_context_definition_path.return_value = mock_complete_config["context_definition_file"]
         mock_config_manager.get_llm_provider.return_value = mock_complete_config["llm_provider"]
@@ -123,36 +183,25 @@ class TestControllerToolRequests(IntegrationTestCase):
         """Test handling of multiple sequential tool requests without user input."""
         # Create and initialize the controller
         controller = framework_controller_factory()
-        controller.initialize()
+        assert initialize_with_mocks(controller) is True
         
         # Mock the UI manager's get_user_input to return a message that triggers tool requests, then /quit
         controller.ui_manager.get_user_input.side_effect = ["Run a series of commands", "/quit"]
         
-        # Create tool requests
-        tool_request_1 = {
-            "request_id": "command-1",
-            "tool_name": "executeBashCommand",
-            "parameters": {"command": "ls"}
-        }
-        
-        tool_request_2 = {
-            "request_id": "command-2",
-            "tool_name": "executeBashCommand",
-            "parameters": {"command": "pwd"}
-        }
-        
         # Configure LLM responses for the sequence:
+        # 0. Opening response, before any user input, with nothing to display
         # 1. First response with tool request 1
         # 2. Second response (after tool result 1) with tool request 2
         # 3. Third response (after tool result 2) with just conversation
         controller.lial_manager.send_messages.side_effect = [
+            ResponseBuilder.conversation(""),
             {
                 "conversation": "I'll run the first command.",
-                "tool_request": tool_request_1
+                "tool_request": _TOOL_REQ_1
             },
             {
                 "conversation": "Now I'll run the second command.",
-                "tool_request": tool_request_2
+                "tool_request": _TOOL_REQ_2
             },
             {
                 "conversation": "I've completed all commands.",
@@ -162,56 +211,29 @@ class TestControllerToolRequests(IntegrationTestCase):
         
         # Mock the tool request handler to return successful results
         controller.tool_request_handler.process_tool_request.side_effect = [
-            {
-                "request_id": "command-1",
-                "tool_name": "executeBashCommand",
-                "status": "success",
-                "data": "file1.txt file2.txt"
-            },
-            {
-                "request_id": "command-2",
-                "tool_name": "executeBashCommand",
-                "status": "success",
-                "data": "/home/user"
-            }
+            _TOOL_RESULT_1,
+            _TOOL_RESULT_2
         ]
         
         # Mock the tool result formatting
         controller.tool_request_handler.format_tool_result_as_message.side_effect = [
-            {
-                "role": "tool_result",
-                "content": "file1.txt file2.txt",
-                "tool_name": "executeBashCommand",
-                "tool_call_id": "command-1"
-            },
-            {
-                "role": "tool_result",
-                "content": "/home/user",
-                "tool_name": "executeBashCommand",
-                "tool_call_id": "command-2"
-            }
+            _TOOL_MSG_1,
+            _TOOL_MSG_2
         ]
         
         # Run the controller
         controller.run()
         
         # Verify the sequence of events
-        assert controller.lial_manager.send_messages.call_count == 3
+        assert controller.lial_manager.send_messages.call_count == 4
         assert controller.tool_request_handler.process_tool_request.call_count == 2
         assert controller.message_manager.add_tool_result_message.call_count == 2
         
         # Verify the tool requests were processed in the correct order
-        controller.tool_request_handler.process_tool_request.assert_has_calls([
-            call(tool_request_1),
-            call(tool_request_2)
-        ])
+        controller.tool_request_handler.process_tool_request.assert_has_calls(_SEQUENTIAL_TOOL_CALLS)
         
         # Verify all assistant messages were added to the history
-        controller.message_manager.add_assistant_message.assert_has_calls([
-            call("I'll run the first command."),
-            call("Now I'll run the second command."),
-            call("I've completed all commands.")
-        ])
+        controller.message_manager.add_assistant_message.assert_has_calls(_SEQUENTIAL_ASSISTANT_CALLS)
     
     def test_tool_request_handler_missing(self, framework_controller_factory):
         """Test behavior when the tool request handler is not initialized."""
@@ -308,20 +330,15 @@ class TestControllerComponentIntegration(IntegrationTestCase):
     Integration tests focusing on the controller's integration with other components.
     """
     
-    def test_dcm_integration(self, framework_controller_factory):
+    def test_dcm_integration(self, controller):
         """Test controller integration with DCM for context management."""
-        # Create a controller instance
-        controller = framework_controller_factory()
-        
         # Configure DCM to return specific context
         controller.dcm_manager.get_initial_prompt.return_value = "Custom system prompt"
-        controller.dcm_manager.get_persona_definitions.return_value = {
-            "catalyst": "Catalyst persona definition",
-            "forge": "Forge persona definition"
-        }
         
-        # Initialize the controller
-        controller.initialize()
+        # Run the DCM initialization and context setup against the reset mocks
+        with patch("framework_core.controller.DCMManager", return_value=controller.dcm_manager):
+            assert controller._initialize_dcm() is True
+        controller._setup_initial_context()
         
         # Verify DCM integration
         controller.dcm_manager.initialize.assert_called_once()
@@ -336,7 +353,7 @@ class TestControllerComponentIntegration(IntegrationTestCase):
         controller = framework_controller_factory()
         
         # Initialize the controller
-        controller.initialize()
+        assert initialize_with_mocks(controller) is True
         
         # Configure UI manager to return a user message that will trigger a tool request
         controller.ui_manager.get_user_input.side_effect = ["Execute command", "/quit"]
@@ -354,6 +371,7 @@ class TestControllerComponentIntegration(IntegrationTestCase):
             "parameters": {"command": "ls -la"}
         }
         controller.lial_manager.send_messages.side_effect = [
+            ResponseBuilder.conversation(""),  # Opening response, before any user input
             {
                 "conversation": "I'll execute that command.",
                 "tool_request": tool_request
@@ -371,6 +389,7 @@ class TestControllerComponentIntegration(IntegrationTestCase):
             "status": "success",
             "data": "total 8\ndrwxr-xr-x 2 user user 4096 May 17 10:00 ."
         }
+        controller.tool_request_handler.process_tool_request.side_effect = None
         controller.tool_request_handler.process_tool_request.return_value = tool_result
         
         # Configure ToolRequestHandler to format the result
@@ -380,6 +399,7 @@ class TestControllerComponentIntegration(IntegrationTestCase):
             "tool_name": "executeBashCommand",
             "tool_call_id": "cmd-123"
         }
+        controller.tool_request_handler.format_tool_result_as_message.side_effect = None
         controller.tool_request_handler.format_tool_result_as_message.return_value = formatted_result
         
         # Run the controller
@@ -393,13 +413,7 @@ class TestControllerComponentIntegration(IntegrationTestCase):
         controller.message_manager.add_tool_result_message.assert_called_once()
         
         # Verify both assistant messages were added
-        controller.message_manager.add_assistant_message.assert_has_calls([
-            call("I'll execute that command."),
-            call("The command has been executed successfully.")
-        ])
+        controller.message_manager.add_assistant_message.assert_has_calls(_LIFECYCLE_ASSISTANT_CALLS)
         
         # Verify UI display
-        controller.ui_manager.display_assistant_message.assert_has_calls([
-            call("I'll execute that command."),
-            call("The command has been executed successfully.")
-        ])
\ No newline at end of file
+        controller.ui_manager.display_assistant_message.assert_has_calls(_LIFECYCLE_ASSISTANT_CALLS)
\ No newline at end of file
@@ -8,32 +8,20 @@ These tests verify that the Framework Controller correctly handles:
 """
 
 import pytest
-import os
-import sys
 from unittest.mock import MagicMock, patch, call
 
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from framework_core.controller import FrameworkController
 from framework_core.exceptions import ToolExecutionError
+from tests.integration.utils import assert_single_call
 
 class TestControllerMessages:
     """
     Integration tests for Framework Controller message and error handling.
     """
     
-    def test_process_messages_with_llm(self):
+    def test_process_messages_with_llm(self, controller_with_mocks):
         """Test processing messages with LLM via LIAL."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        mock_config.config = {"default_persona": "forge"}
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create mock LIAL manager
-        controller.lial_manager = MagicMock(name="LIALManager")
+        # Create controller with the shared mock config ("forge" default persona)
+        controller, _ = controller_with_mocks
         
         # Configure messages
         messages = [
@@ -55,18 +43,40 @@ class TestControllerMessages:
         assert result == expected_response
         controller.lial_manager.send_messages.assert_called_once_with(messages, active_persona_id="forge")
     
-    def test_handle_tool_request(self):
-        """Test handling a tool request via the Tool Request Handler."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
+    def test_process_messages_cache_hit(self, controller_with_mocks):
+        """Test that identical messages are answered from the LLM response cache."""
+        # Create controller with the shared mock config and component mocks
+        controller, _ = controller_with_mocks
         
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
+        # Enable the cache (normally done by _initialize_lial for temperature 0)
+        controller.llm_cache_enabled = True
         
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.tool_request_handler = MagicMock(name="ToolRequestHandler")
+        messages = [
+            {"role": "system", "content": "You are an AI assistant."},
+            {"role": "user", "content": "Hello, assistant!"}
+        ]
+        controller.lial_manager.send_messages.return_value = {
+            "conversation": "Hello! I'm an AI assistant. How can I help you today?",
+            "tool_request": None
+        }
+        
+        # Process the same messages twice
+        first = controller._process_messages_with_llm(messages)
+        second = controller._process_messages_with_llm(list(messages))
+        
+        # Verify the LLM was only called once and both results match
+        assert controller.lial_manager.send_messages.call_count == 1
+        assert second == first
+        
+        # Verify a different persona misses the cache
+        controller.active_persona_id = "catalyst"
+        controller._process_messages_with_llm(messages)
+        assert controller.lial_manager.send_messages.call_count == 2
+    
+    def test_handle_tool_request(self, controller_with_mocks):
+        """Test handling a tool request via the Tool Request Handler."""
+        # Create controller with the shared mock config and component mocks
+        controller, _ = controller_with_mocks
         
         # Create a tool request
         tool_request = {
@@ -99,13 +109,14 @@ class TestControllerMessages:
         controller._handle_tool_request(tool_request)
         
         # Verify tool request was processed
-        controller.tool_request_handler.process_tool_request.assert_called_once_with(tool_request)
+        assert_single_call(controller.tool_request_handler.process_tool_request, tool_request)
         
         # Verify tool result was formatted
-        controller.tool_request_handler.format_tool_result_as_message.assert_called_once_with(tool_result)
+        assert_single_call(controller.tool_request_handler.format_tool_result_as_message, tool_result)
         
         # Verify tool result was added to message history
-        controller.message_manager.add_tool_result_message.assert_called_once_with(
+        assert_single_call(
+            controller.message_manager.add_tool_result_message,
             tool_name="readFile",
             content="Test content",
             tool_call_id="read-123"
@@ -114,19 +125,40 @@ class TestControllerMessages:
         # Verify debug message was displayed since debug mode is enabled
         controller.ui_manager.display_system_message.assert_called_once()
         
-    def test_handle_tool_execution_error(self):
-        """Test handling of tool execution errors."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
+    def test_handle_tool_requests_batch(self, controller_with_mocks):
+        """Test handling several tool requests from a single LLM response."""
+        # Create controller with the shared mock config and component mocks
+        controller, _ = controller_with_mocks
         
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
+        tool_requests = [
+            {"request_id": "read-1", "tool_name": "readFile", "parameters": {"file_path": "a.txt"}},
+            {"request_id": "read-2", "tool_name": "readFile", "parameters": {"file_path": "b.txt"}},
+            {"request_id": "bash-3", "tool_name": "executeBashCommand", "parameters": {"command": "ls"}},
+        ]
+        controller.tool_request_handler.format_tool_result_as_message.return_value = {
+            "role": "tool_result",
+            "content": "Test content",
+            "tool_name": "readFile",
+            "tool_call_id": "read-1"
+        }
         
-        # Create and attach mocks for required components
-        controller.message_manager = MagicMock(name="MessageManager")
-        controller.ui_manager = MagicMock(name="UIManager")
-        controller.tool_request_handler = MagicMock(name="ToolRequestHandler")
-        controller.error_handler = MagicMock(name="ErrorHandler")
+        # Call the method directly
+        controller._handle_tool_requests(tool_requests)
+        
+        # Verify each request was processed in order and its result recorded
+        assert controller.tool_request_handler.process_tool_request.call_args_list == [
+            call(tool_request) for tool_request in tool_requests
+        ]
+        assert controller.message_manager.add_tool_result_message.call_count == len(tool_requests)
+        
+        # Verify a single tool request is still accepted
+        controller._handle_tool_requests(tool_requests[0])
+        assert controller.tool_request_handler.process_tool_request.call_count == len(tool_requests) + 1
+        
+    def test_handle_tool_execution_error(self, controller_with_mocks):
+        """Test handling of tool execution errors."""
+        # Create controller with the shared mock config and component mocks
+        controller, _ = controller_with_mocks
         
         # Create a tool request
         tool_request = {
@@ -166,17 +198,10 @@ class TestControllerMessages:
         # Verify error content in message
         assert "error" in controller.message_manager.add_tool_result_message.call_args[1]["content"].lower()
     
-    def test_process_messages_with_llm_error_handling(self):
+    def test_process_messages_with_llm_error_handling(self, controller_with_mocks):
         """Test error handling in the process_messages_with_llm method."""
-        # Create mock components
-        mock_config = MagicMock(name="ConfigurationManager")
-        
-        # Create controller with mock config
-        controller = FrameworkController(mock_config)
-        
-        # Create mocks for required components
-        controller.lial_manager = MagicMock(name="LIALManager")
-        controller.error_handler = MagicMock(name="ErrorHandler")
+        # Create controller with the shared mock config and component mocks
+        controller, _ = controller_with_mocks
         
         # Configure LLM to raise an exception
         controller.lial_manager.send_messages.side_effect = Exception("Runtime error")
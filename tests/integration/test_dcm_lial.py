@@ -6,13 +6,8 @@ and the LLM Interaction Abstraction Layer (LIAL) components.
 """
 
 import pytest
-import os
-import sys
 from unittest.mock import MagicMock, patch
 
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from framework_core.exceptions import DCMInitError, LIALInitError
 from framework_core.component_managers.dcm_manager import DCMManager
 from framework_core.component_managers.lial_manager import LIALManager
@@ -44,7 +39,7 @@ class TestDCMLIALIntegration(IntegrationTestCase):
         
         # Create mock DCM manager
         self.dcm_manager = MagicMock(name="DCMManager")
-        self.dcm_manager.get_document_content.side_effect = lambda doc_id: self.mock_context_content.get(doc_id)
+        self.dcm_manager.get_document_content.side_effect = self.mock_context_content.get
         self.dcm_manager.get_full_context.return_value = self.mock_context_content
         self.dcm_manager.get_initial_prompt.return_value = self.mock_context_content["main_system_prompt"]
         self.dcm_manager.get_persona_definitions.return_value = {
@@ -54,7 +49,7 @@ class TestDCMLIALIntegration(IntegrationTestCase):
         
         # Create mock DCM instance
         self.dcm_instance = MagicMock(name="DynamicContextManager")
-        self.dcm_instance.get_document_content.side_effect = lambda doc_id: self.mock_context_content.get(doc_id)
+        self.dcm_instance.get_document_content.side_effect = self.mock_context_content.get
         self.dcm_instance.get_full_initial_context.return_value = self.mock_context_content
         self.dcm_instance.get_initial_prompt_template.return_value = self.mock_context_content["main_system_prompt"]
         self.dcm_instance.get_persona_definitions.return_value = {
@@ -8,14 +8,9 @@ These tests verify the integration between all three core components:
 """
 
 import pytest
-import os
-import sys
 import json
 from unittest.mock import MagicMock, patch
 
-# Ensure framework_core is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from framework_core.exceptions import DCMInitError, LIALInitError, TEPSInitError, ToolExecutionError
 from framework_core.component_managers.dcm_manager import DCMManager
 from framework_core.component_managers.lial_manager import LIALManager
@@ -49,7 +44,7 @@ class TestDCMLIALTEPSIntegration(IntegrationTestCase):
         
         # Create mock DCM instance
         self.dcm_instance = MagicMock(name="DynamicContextManager")
-        self.dcm_instance.get_document_content.side_effect = lambda doc_id: self.mock_context_content.get(doc_id)
+        self.dcm_instance.get_document_content.side_effect = self.mock_context_content.get
         self.dcm_instance.get_full_initial_context.return_value = self.mock_context_content
         self.dcm_instance.get_initial_prompt_template.return_value = self.mock_context_content["main_system_prompt"]
         self.dcm_instance.get_persona_definitions.return_value = {
@@ -158,10 +158,7 @@ class TestPersonaSwitchingIntegration(IntegrationTestCase):
         controller.ui_manager.get_user_input.side_effect = ["/persona invalid", "/quit"]
         
         # Mock LLM response
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
+        controller.lial_manager.send_messages.return_value = ResponseBuilder.canned("I am an AI assistant.")
         
         # Run the controller
         controller.run()
@@ -188,10 +185,7 @@ class TestPersonaSwitchingIntegration(IntegrationTestCase):
         controller.ui_manager.get_user_input.side_effect = ["/persona", "/quit"]
         
         # Mock LLM response
-        controller.lial_manager.send_messages.return_value = {
-            "conversation": "I am an AI assistant.",
-            "tool_request": None
-        }
+        controller.lial_manager.send_messages.return_value = ResponseBuilder.canned("I am an AI assistant.")
         
         # Run the controller
         controller.run()
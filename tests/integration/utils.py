@@ -10,8 +10,9 @@ for the KeystoneAI-Framework, including:
 
 import io
 import sys
+from collections import deque
 from typing import Dict, List, Optional, Any, Callable, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from framework_core.lial_core import LLMAdapterInterface, Message, LLMResponse, ToolRequest
 
@@ -65,6 +66,9 @@ class MockLLMAdapter(LLMAdapterInterface):
             "malformed": {"invalid": "format"}
         }
         
+        # Scripted responses, served in order when set (see script_responses)
+        self.scripted_responses = None
+        
         # Tracking for test verification
         self.call_history = []
         self.call_count = 0
@@ -89,6 +93,21 @@ class MockLLMAdapter(LLMAdapterInterface):
         """
         self.patterns[pattern] = response_key
     
+    def script_responses(self, responses: List[Dict[str, Any]]) -> None:
+        """
+        Serve responses in order instead of matching them on the messages.
+        
+        The next scripted response answers each call whose last message is a
+        user message or tool result. Any other call (the opening call before
+        the first user input, or the call after a special command) has
+        nothing new to answer and gets a response without conversation text.
+        Once the script is exhausted, the default response is returned.
+        
+        Args:
+            responses: Responses in the order they are expected
+        """
+        self.scripted_responses = deque(responses)
+    
     def configure_error(self, key: str, error: Exception) -> None:
         """
         Configure an error response.
@@ -103,9 +122,35 @@ class MockLLMAdapter(LLMAdapterInterface):
         """Clear all configured responses and patterns."""
         self.responses = {"default": self.responses["default"]}
         self.patterns = {}
+        self.scripted_responses = None
+        self.reset_call_log()
+    
+    def reset_call_log(self) -> None:
+        """Clear the call tracking state, keeping configured responses."""
         self.call_history = []
         self.call_count = 0
     
+    def __copy__(self) -> 'MockLLMAdapter':
+        """
+        Create a copy that can be configured independently of this adapter.
+        
+        The response tables are copied (the response dicts themselves are
+        shared) and the copy starts with an empty call log.
+        
+        Returns:
+            The copied adapter
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.responses = dict(self.responses)
+        clone.patterns = dict(self.patterns)
+        clone.persona_responses = dict(self.persona_responses)
+        clone.error_responses = dict(self.error_responses)
+        if self.scripted_responses is not None:
+            clone.scripted_responses = deque(self.scripted_responses)
+        clone.reset_call_log()
+        return clone
+    
     def _find_matching_response(self, messages: List[Message], active_persona_id: Optional[str]) -> Dict[str, Any]:
         """
         Find the appropriate response based on message content and active persona.
@@ -125,8 +170,9 @@ class MockLLMAdapter(LLMAdapterInterface):
                 break
         
         if last_user_message:
+            last_user_message_lower = last_user_message.lower()
             for pattern, response_key in self.patterns.items():
-                if pattern.lower() in last_user_message.lower():
+                if pattern.lower() in last_user_message_lower:
                     return self.responses.get(response_key, self.responses["default"])
         
         # Check for persona-specific response
@@ -175,8 +221,28 @@ class MockLLMAdapter(LLMAdapterInterface):
                         raise error
                     return error
         
+        if self.scripted_responses is not None:
+            return self._next_scripted_response(messages)
+        
         # Find and return the appropriate response
         return self._find_matching_response(messages, active_persona_id)
+    
+    def _next_scripted_response(self, messages: List[Message]) -> Dict[str, Any]:
+        """
+        Return the next scripted response if the messages end with new input.
+        
+        Args:
+            messages: List of messages to analyze
+            
+        Returns:
+            The next scripted response, the default response once the script is
+            exhausted, or a response without conversation text
+        """
+        if not messages or messages[-1].get("role") not in ("user", "tool"):
+            return {"conversation": "", "tool_request": None}
+        if self.scripted_responses:
+            return self.scripted_responses.popleft()
+        return self.responses["default"]
 
 
 class ResponseBuilder:
@@ -203,6 +269,26 @@ class ResponseBuilder:
             "tool_request": None
         }
     
+    @staticmethod
+    def canned(conversation: str, tool_request: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """
+        Return a new response with the given conversation text.
+        
+        Each call builds a fresh dict, so a response mutated by the code under
+        test does not leak into other tests.
+        
+        Args:
+            conversation: The conversation text
+            tool_request: Optional tool request, copied into the response
+            
+        Returns:
+            LLMResponse with the conversation text and tool request
+        """
+        return {
+            "conversation": conversation,
+            "tool_request": dict(tool_request) if tool_request is not None else None
+        }
+    
     @staticmethod
     def tool_request(
         tool_name: str, 
@@ -317,6 +403,11 @@ class MockIOCapture:
         self.stdout_capture = io.StringIO()
         self.stderr_capture = io.StringIO()
         self.input_queue = []
+        
+        # Whether mocked UI components print their display output; only
+        # needed by tests that inspect the captured stdout
+        self.capture_enabled = False
+        
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
         self.original_input = input
@@ -326,6 +417,18 @@ class MockIOCapture:
         sys.stdout = self.stdout_capture
         sys.stderr = self.stderr_capture
     
+    def start_capture_via(self, monkeypatch) -> None:
+        """
+        Start capturing stdout and stderr using pytest's monkeypatch.
+        
+        The streams are restored when monkeypatch is undone.
+        
+        Args:
+            monkeypatch: pytest monkeypatch fixture
+        """
+        monkeypatch.setattr(sys, "stdout", self.stdout_capture)
+        monkeypatch.setattr(sys, "stderr", self.stderr_capture)
+    
     def stop_capture(self) -> None:
         """Stop capturing and restore original stdout and stderr."""
         sys.stdout = self.original_stdout
@@ -340,6 +443,15 @@ class MockIOCapture:
         """
         self.input_queue.extend(inputs)
     
+    def extend_inputs(self, inputs) -> None:
+        """
+        Add an iterable of inputs to the queue for simulation.
+        
+        Args:
+            inputs: Input strings to queue
+        """
+        self.input_queue.extend(inputs)
+    
     def mock_input(self, prompt: str = "") -> str:
         """
         Mock the input function.
@@ -361,6 +473,17 @@ class MockIOCapture:
         """Patch the built-in input function with our mock."""
         __builtins__["input"] = self.mock_input
     
+    def patch_input_via(self, monkeypatch) -> None:
+        """
+        Patch the built-in input function using pytest's monkeypatch.
+        
+        The original function is restored when monkeypatch is undone.
+        
+        Args:
+            monkeypatch: pytest monkeypatch fixture
+        """
+        monkeypatch.setattr("builtins.input", self.mock_input)
+    
     def restore_input(self) -> None:
         """Restore the original input function."""
         __builtins__["input"] = self.original_input
@@ -434,6 +557,60 @@ class MockIOCapture:
         return bool(re.search(pattern, stdout))
 
 
+# Component classes FrameworkController.initialize constructs, with the
+# controller attributes holding them
+_CONTROLLER_COMPONENTS = (
+    ("DCMManager", "dcm_manager"),
+    ("LIALManager", "lial_manager"),
+    ("TEPSManager", "teps_manager"),
+    ("MessageManager", "message_manager"),
+    ("UserInterfaceManager", "ui_manager"),
+    ("ToolRequestHandler", "tool_request_handler"),
+)
+
+
+def initialize_with_mocks(controller: Any) -> bool:
+    """
+    Initialize a controller, keeping the mock components already attached to it.
+    
+    initialize() constructs every component itself, so the component classes
+    are patched to hand back the controller's current mocks instead.
+    
+    Args:
+        controller: FrameworkController with mock components attached
+        
+    Returns:
+        The result of controller.initialize()
+    """
+    component_classes = {
+        class_name: MagicMock(return_value=getattr(controller, attr))
+        for class_name, attr in _CONTROLLER_COMPONENTS
+    }
+    with patch.multiple("framework_core.controller", **component_classes):
+        return controller.initialize()
+
+
+def assert_single_call(mock: Any, *args, **kwargs) -> None:
+    """
+    Assert that a mock was called exactly once with the given arguments.
+    
+    Compares the recorded args and kwargs directly, avoiding the _Call
+    construction and signature binding done by assert_called_once_with.
+    
+    Args:
+        mock: The mock to check
+        *args: Expected positional arguments
+        **kwargs: Expected keyword arguments
+    """
+    assert mock.call_count == 1, (
+        f"Expected '{mock}' to have been called once. Called {mock.call_count} times."
+    )
+    actual_args, actual_kwargs = mock.call_args
+    assert (actual_args, actual_kwargs) == (args, kwargs), (
+        f"Expected call: {args} {kwargs}\nActual call: {actual_args} {actual_kwargs}"
+    )
+
+
 class IntegrationTestCase:
     """
     Base class for integration tests with common setup and assertions.
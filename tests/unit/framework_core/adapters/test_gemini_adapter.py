@@ -268,6 +268,49 @@ class TestGeminiAdapter:
             assert response["conversation"] == "LLM response text"
             assert response["tool_request"] is None
 
+    @patch('os.environ.get')
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_stream_message_sequence_text_response(self, mock_generative_model, mock_genai_configure, mock_os_environ_get, valid_config, mock_dcm):
+        """Test streaming a message sequence with a text response"""
+        # Setup mocks
+        mock_os_environ_get.return_value = "fake-api-key"
+        
+        # Setup adapter
+        with patch('google.ai.generativelanguage'):
+            adapter = GeminiAdapter(valid_config, mock_dcm)
+            adapter._convert_messages_to_gemini_format = MagicMock(return_value=[
+                {"role": "user", "parts": [{"text": "User message"}]}
+            ])
+            adapter._get_dynamic_system_instruction = MagicMock(return_value="Dynamic system instruction")
+            
+            # Create one streamed response chunk per piece of text
+            def make_chunk(text):
+                chunk = MagicMock()
+                chunk.candidates = [
+                    MagicMock(content=MagicMock(parts=[MagicMock(text=text, function_call=None)]))
+                ]
+                return chunk
+            
+            # Setup chat session and model
+            mock_chat_session = MagicMock()
+            mock_chat_session.send_message.return_value = iter([make_chunk("LLM "), make_chunk("response text")])
+            mock_model_instance = MagicMock()
+            mock_model_instance.start_chat.return_value = mock_chat_session
+            mock_generative_model.return_value = mock_model_instance
+            
+            messages: List[Message] = [
+                {"role": "user", "content": "Hello!"}
+            ]
+            
+            # Stream message sequence
+            chunks = list(adapter.stream_message_sequence(messages))
+            
+            # Verify the streamed request and chunks
+            mock_chat_session.send_message.assert_called_once_with("Hello!", stream=True)
+            assert [chunk["conversation"] for chunk in chunks] == ["LLM ", "response text"]
+            assert all(chunk["tool_request"] is None for chunk in chunks)
+
     @patch('os.environ.get')
     @patch('google.generativeai.configure')
     @patch('google.generativeai.GenerativeModel')
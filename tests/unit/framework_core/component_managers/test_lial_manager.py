@@ -143,6 +143,27 @@ class TestLIALManager:
         mock_adapter_instance.send_message_sequence.assert_called_once_with(messages, active_persona_id=active_persona_id)
         assert response == expected_response
 
+    @patch('framework_core.adapters.gemini_adapter.GeminiAdapter')
+    def test_send_messages_stream(self, mock_gemini_adapter_class, valid_config, mock_dcm_manager):
+        """Test that stream=True returns the adapter's response stream"""
+        mock_adapter_instance = MagicMock()
+        chunks = [
+            {"conversation": "Response ", "tool_request": None},
+            {"conversation": "from LLM", "tool_request": None}
+        ]
+        mock_adapter_instance.stream_message_sequence.return_value = iter(chunks)
+        mock_gemini_adapter_class.return_value = mock_adapter_instance
+        
+        manager = LIALManager(valid_config["llm_provider"], valid_config["llm_settings"], mock_dcm_manager)
+        manager.initialize()
+        
+        messages: List[Dict[str, Any]] = [{"role": "user", "content": "Hello!"}]
+        response = manager.send_messages(messages, "catalyst", stream=True)
+        
+        mock_adapter_instance.stream_message_sequence.assert_called_once_with(messages, active_persona_id="catalyst")
+        mock_adapter_instance.send_message_sequence.assert_not_called()
+        assert list(response) == chunks
+
     def test_send_messages_without_initialization(self, valid_config, mock_dcm_manager):
         """Test sending messages without initializing adapter"""
         llm_provider = valid_config["llm_provider"]
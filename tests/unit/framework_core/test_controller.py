@@ -244,6 +244,51 @@ class TestFrameworkController(unittest.TestCase):
             # Verify lial_manager assignment
             self.assertEqual(self.controller.lial_manager, self.mock_lial_manager)
 
+    def test_initialize_lial_enables_cache_for_temperature_zero(self):
+        """Test that LIAL initialization enables the response cache only at temperature 0."""
+        self.controller.dcm_manager = self.mock_dcm_manager
+        
+        with patch('framework_core.controller.LIALManager', return_value=self.mock_lial_manager):
+            self.controller._initialize_lial()
+            self.assertFalse(self.controller.llm_cache_enabled)
+            
+            self.mock_config_manager.get_llm_settings.return_value = {'max_tokens': 1000, 'temperature': 0}
+            self.controller._initialize_lial()
+            self.assertTrue(self.controller.llm_cache_enabled)
+
+    def test_process_messages_with_llm_cache_eviction(self):
+        """Test that the LLM response cache evicts the least recently used entry."""
+        self.controller.lial_manager = self.mock_lial_manager
+        self.controller.llm_cache_enabled = True
+        self.mock_lial_manager.send_messages.return_value = {"conversation": "Hi", "tool_request": None}
+        
+        with patch.object(FrameworkController, 'LLM_CACHE_SIZE', 2):
+            for content in ("first", "second", "third"):
+                self.controller._process_messages_with_llm([{"role": "user", "content": content}])
+            
+            # The oldest entry was evicted, so it is sent to the LLM again
+            self.controller._process_messages_with_llm([{"role": "user", "content": "third"}])
+            self.assertEqual(self.mock_lial_manager.send_messages.call_count, 3)
+            self.controller._process_messages_with_llm([{"role": "user", "content": "first"}])
+            self.assertEqual(self.mock_lial_manager.send_messages.call_count, 4)
+
+    def test_process_messages_with_llm_cache_non_str_keys(self):
+        """Test that messages with non-string keys are cached, and unserializable ones are not."""
+        self.controller.lial_manager = self.mock_lial_manager
+        self.controller.llm_cache_enabled = True
+        self.mock_lial_manager.send_messages.return_value = {"conversation": "Hi", "tool_request": None}
+        
+        messages = [{"role": "user", "content": "Hello", "metadata": {1: "one", 2: "two"}}]
+        self.assertEqual(self.controller._process_messages_with_llm(messages)["conversation"], "Hi")
+        self.assertEqual(self.controller._process_messages_with_llm(messages)["conversation"], "Hi")
+        self.assertEqual(self.mock_lial_manager.send_messages.call_count, 1)
+        
+        # Keys of mixed types cannot be sorted, so the LLM is still called
+        messages = [{"role": "user", "content": "Hello", "metadata": {1: "one", "two": 2}}]
+        self.assertEqual(self.controller._process_messages_with_llm(messages)["conversation"], "Hi")
+        self.assertEqual(self.mock_lial_manager.send_messages.call_count, 2)
+        self.assertEqual(len(self.controller._llm_cache), 1)
+
     def test_initialize_lial_no_dcm(self):
         """Test LIAL initialization fails when DCM is not initialized."""
         # Ensure dcm_manager is None
@@ -725,6 +770,66 @@ class TestFrameworkController(unittest.TestCase):
         self.assertTrue("error while communicating with the LLM" in result["conversation"])
 
 
+    def test_stream_messages_with_llm_success(self):
+        """Test _stream_messages_with_llm displays chunks and returns the full response."""
+        self.controller.lial_manager = self.mock_lial_manager
+        self.controller.ui_manager = self.mock_ui_manager
+        self.controller.active_persona_id = "forge"
+        
+        messages = [{"role": "user", "content": "Read file.txt"}]
+        tool_request = {"request_id": "read-1", "tool_name": "readFile", "parameters": {"file_path": "file.txt"}}
+        self.mock_lial_manager.send_messages.return_value = iter([
+            {"conversation": "I'll read ", "tool_request": None},
+            {"conversation": "that file.", "tool_request": None},
+            {"conversation": "", "tool_request": tool_request}
+        ])
+        
+        result = self.controller._stream_messages_with_llm(messages)
+        
+        self.mock_lial_manager.send_messages.assert_called_once_with(
+            messages,
+            active_persona_id="forge",
+            stream=True
+        )
+        self.assertEqual(
+            self.mock_ui_manager.stream_assistant_chunk.call_args_list,
+            [call("I'll read "), call("that file.")]
+        )
+        self.mock_ui_manager.end_assistant_stream.assert_called_once()
+        self.assertEqual(result, {"conversation": "I'll read that file.", "tool_request": tool_request})
+
+    def test_stream_messages_with_llm_exception(self):
+        """Test _stream_messages_with_llm handles errors raised while streaming."""
+        self.controller.lial_manager = self.mock_lial_manager
+        self.controller.ui_manager = self.mock_ui_manager
+        self.mock_lial_manager.send_messages.side_effect = Exception("LLM processing error")
+        
+        result = self.controller._stream_messages_with_llm([{"role": "user", "content": "Hello"}])
+        
+        self.assertIsNone(result["tool_request"])
+        self.assertTrue("error while communicating with the LLM" in result["conversation"])
+        self.mock_ui_manager.stream_assistant_chunk.assert_called_once_with(result["conversation"])
+        self.mock_ui_manager.end_assistant_stream.assert_called_once()
+
+    def test_run_streamed_response(self):
+        """Test that run() records a streamed response without displaying it again."""
+        self.controller.message_manager = self.mock_message_manager
+        self.controller.ui_manager = self.mock_ui_manager
+        self.controller.lial_manager = self.mock_lial_manager
+        self.controller.stream_responses = True
+        
+        self.mock_message_manager.get_messages.return_value = [{"role": "user", "content": "Hello"}]
+        self.mock_lial_manager.send_messages.return_value = iter([
+            {"conversation": "Hello!", "tool_request": None}
+        ])
+        self.mock_ui_manager.get_user_input.return_value = "/quit"
+        
+        self.controller.run()
+        
+        self.mock_ui_manager.stream_assistant_chunk.assert_called_once_with("Hello!")
+        self.mock_message_manager.add_assistant_message.assert_called_once_with("Hello!")
+        self.mock_ui_manager.display_assistant_message.assert_not_called()
+
     def test_handle_tool_request_success(self):
         """Test successful handling of a tool request."""
         # Set up dependencies
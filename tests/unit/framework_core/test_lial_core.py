@@ -151,4 +151,19 @@ class TestLLMAdapterInterface:
         response = adapter.send_message_sequence(messages)
         assert response["text"] == "Response from concrete adapter"
         assert response["error"] is None
-        assert response["tool_requests"] is None
\ No newline at end of file
+        assert response["tool_requests"] is None
+
+    def test_default_stream_message_sequence(self):
+        """Test that the default streaming implementation yields the full response once"""
+        class ConcreteAdapter(LLMAdapterInterface):
+            def __init__(self, config: Dict[str, Any], dcm_instance: Optional[Any] = None):
+                self.config = config
+            
+            def send_message_sequence(self, messages: List[Message], active_persona_id: Optional[str] = None) -> LLMResponse:
+                return {"conversation": f"Hello from {active_persona_id}", "tool_request": None}
+        
+        adapter = ConcreteAdapter({})
+        messages: List[Message] = [{"role": "user", "content": "Hello!"}]
+        
+        chunks = list(adapter.stream_message_sequence(messages, active_persona_id="forge"))
+        assert chunks == [{"conversation": "Hello from forge", "tool_request": None}]
@@ -5,12 +5,13 @@ This module tests all the functionality of the UserInterfaceManager class
 located in framework_core/ui_manager.py.
 """
 
+import io
 import pytest
 import sys
 import os
 from unittest.mock import patch, MagicMock, call
 
-from framework_core.ui_manager import UserInterfaceManager
+from framework_core.ui_manager import UserInterfaceManager, _detect_color_support
 
 
 class TestUserInterfaceManager:
@@ -173,6 +174,64 @@ class TestUserInterfaceManager:
         expected_message = f"{ui_manager.error_prefix}ValidationError: Invalid input format."
         mock_output_handler.assert_called_once_with(expected_message)
     
+    def test_display_empty_messages_are_skipped(self, capsys):
+        """Test that empty messages are not printed by the default output handler."""
+        ui_manager = UserInterfaceManager(config={"use_color": False})
+        
+        ui_manager.display_assistant_message("")
+        ui_manager.display_system_message("")
+        ui_manager.display_error_message("", "")
+        
+        # Check that nothing was printed
+        assert capsys.readouterr().out == ""
+    
+    def test_display_empty_messages_custom_handler(self):
+        """Test that a custom output handler still receives empty messages."""
+        mock_output_handler = MagicMock()
+        
+        ui_manager = UserInterfaceManager(output_handler=mock_output_handler)
+        
+        ui_manager.display_assistant_message("")
+        ui_manager.display_system_message("")
+        ui_manager.display_error_message("", "")
+        
+        # Check that the output handler was called for every message
+        assert mock_output_handler.call_count == 3
+    
+    def test_stream_assistant_chunks_default_output(self, capsys):
+        """Test streaming an assistant message to stdout with the default handler."""
+        ui_manager = UserInterfaceManager(config={"use_color": False})
+        
+        ui_manager.stream_assistant_chunk("Hello")
+        ui_manager.stream_assistant_chunk("")
+        ui_manager.stream_assistant_chunk(", world")
+        ui_manager.end_assistant_stream()
+        
+        # Check that the prefix is written once, before the first chunk
+        assert capsys.readouterr().out == f"{ui_manager.assistant_prefix}Hello, world\n"
+    
+    def test_stream_assistant_chunks_custom_output(self):
+        """Test streaming an assistant message with a custom output handler."""
+        mock_output_handler = MagicMock()
+        
+        ui_manager = UserInterfaceManager(
+            config={"use_color": False},
+            output_handler=mock_output_handler
+        )
+        
+        ui_manager.stream_assistant_chunk("Hello")
+        ui_manager.stream_assistant_chunk(", world")
+        
+        # Check that chunks are buffered until the stream ends
+        mock_output_handler.assert_not_called()
+        
+        ui_manager.end_assistant_stream()
+        mock_output_handler.assert_called_once_with(f"{ui_manager.assistant_prefix}Hello, world")
+        
+        # Ending again without new chunks outputs nothing
+        ui_manager.end_assistant_stream()
+        assert mock_output_handler.call_count == 1
+    
     def test_get_user_input_with_default_prompt(self):
         """Test getting user input with the default prompt."""
         mock_input_handler = MagicMock(return_value="Test user input")
@@ -289,6 +348,30 @@ class TestUserInterfaceManager:
         # Check that the result is an empty string
         assert result == ""
     
+    def test_get_multiline_input_piped_stdin(self):
+        """Test getting multi-line input from non-TTY stdin without input()."""
+        mock_output_handler = MagicMock()
+        ui_manager = UserInterfaceManager(output_handler=mock_output_handler)
+        
+        piped = io.StringIO("Line 1\nLine 2\n\nLine 4\n")
+        with patch.object(sys, 'stdin', piped), patch('builtins.input') as mock_input:
+            result = ui_manager.get_multiline_input()
+            
+            # Input is not read line by line
+            mock_input.assert_not_called()
+        
+        # Check that input stops at the first empty line, leaving the rest unread
+        assert result == "Line 1\nLine 2"
+        assert piped.read() == "Line 4\n"
+        
+        piped = io.StringIO("Line 1\n\nLine 3\nEND\nLine 5\n")
+        with patch.object(sys, 'stdin', piped):
+            result = ui_manager.get_multiline_input(end_marker="END")
+        
+        # Check that input stops at the end marker only
+        assert result == "Line 1\n\nLine 3"
+        assert piped.read() == "Line 5\n"
+    
     def test_display_special_command_help_with_commands(self):
         """Test displaying help for special commands."""
         mock_output_handler = MagicMock()
@@ -359,11 +442,20 @@ class TestUserInterfaceManager:
             # Check that print was called with the message
             mock_print.assert_called_once_with("Test message")
     
+    def test_supports_color_uses_cached_detection(self):
+        """Test that color support is detected once rather than per instance."""
+        with patch('framework_core.ui_manager._COLOR_SUPPORTED', True), \
+             patch.dict(os.environ, {"NO_COLOR": "1"}):
+            ui_manager = UserInterfaceManager()
+            
+            # The cached result is used even though NO_COLOR is now set
+            assert ui_manager._supports_color() is True
+            assert ui_manager.use_color is True
+    
     def test_supports_color_no_color_env_var(self):
         """Test color support detection when NO_COLOR environment variable is set."""
         with patch.dict(os.environ, {"NO_COLOR": "1"}):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # NO_COLOR being set should return False
             assert result is False
@@ -371,8 +463,7 @@ class TestUserInterfaceManager:
     def test_supports_color_not_a_tty(self):
         """Test color support detection when stdout is not a TTY."""
         with patch.object(sys.stdout, 'isatty', return_value=False):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Not a TTY should return False
             assert result is False
@@ -382,8 +473,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"ANSICON": "1"}), \
              patch('sys.platform', 'win32'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Windows with ANSICON should return True
             assert result is True
@@ -393,8 +483,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"WT_SESSION": "1"}), \
              patch('sys.platform', 'win32'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Windows with WT_SESSION should return True
             assert result is True
@@ -404,8 +493,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"ConEmuANSI": "1"}), \
              patch('sys.platform', 'win32'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Windows with ConEmuANSI should return True
             assert result is True
@@ -415,8 +503,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"TERM_PROGRAM": "vscode"}), \
              patch('sys.platform', 'win32'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Windows in VSCode terminal should return True
             assert result is True
@@ -426,8 +513,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, clear=True), \
              patch('sys.platform', 'win32'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Windows without special env vars should return False
             assert result is False
@@ -437,8 +523,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"TERM": "xterm-256color"}), \
              patch('sys.platform', 'linux'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Unix with valid TERM should return True
             assert result is True
@@ -448,8 +533,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, {"TERM": "dumb"}), \
              patch('sys.platform', 'linux'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Unix with TERM=dumb should return False
             assert result is False
@@ -459,8 +543,7 @@ class TestUserInterfaceManager:
         with patch.dict(os.environ, clear=True), \
              patch('sys.platform', 'darwin'), \
              patch.object(sys.stdout, 'isatty', return_value=True):
-            ui_manager = UserInterfaceManager()
-            result = ui_manager._supports_color()
+            result = _detect_color_support()
             
             # Unix without TERM should return False
             assert result is False
\ No newline at end of file
@@ -10,7 +10,7 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock, call
 
-from framework_core.utils.logging_utils import setup_logger
+from framework_core.utils.logging_utils import setup_logger, _DEFAULT_FORMATTER
 
 
 class TestLoggingUtils:
@@ -117,13 +117,12 @@ class TestLoggingUtils:
             # Verify handler level was set correctly
             mock_handler.setLevel.assert_called_once_with(logging.DEBUG)
             
-            # Verify formatter was created with default format
-            mock_formatter.assert_called_once_with(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
+            # Verify the shared default formatter was used rather than a new one
+            mock_formatter.assert_not_called()
+            assert _DEFAULT_FORMATTER._fmt == '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             
             # Verify formatter was added to handler
-            mock_handler.setFormatter.assert_called_once_with(mock_format)
+            mock_handler.setFormatter.assert_called_once_with(_DEFAULT_FORMATTER)
             
             # Verify handler was added to logger
             mock_logger.addHandler.assert_called_once_with(mock_handler)
@@ -169,7 +168,7 @@ class TestLoggingUtils:
             mock_file.setLevel.assert_called_once_with(logging.INFO)
             
             # Verify formatter was added to FileHandler
-            mock_file.setFormatter.assert_called_once_with(mock_format)
+            mock_file.setFormatter.assert_called_once_with(_DEFAULT_FORMATTER)
             
             # Verify both handlers were added to logger
             assert mock_logger.addHandler.call_count == 2
@@ -221,7 +220,7 @@ class TestLoggingUtils:
             mock_file.setLevel.assert_called_once_with(logging.DEBUG)
             
             # Verify formatter was added to FileHandler
-            mock_file.setFormatter.assert_called_once_with(mock_format)
+            mock_file.setFormatter.assert_called_once_with(_DEFAULT_FORMATTER)
             
             # Verify both handlers were added to logger
             assert mock_logger.addHandler.call_count == 2
@@ -290,4 +289,23 @@ class TestLoggingUtils:
             # Check if there was a condition that would have triggered
             # handler clearing, and if our implementation of handlers.clear()
             # was correctly called
-            assert mock_handlers.__bool__.call_count > 0, "Logger.handlers wasn't checked"
\ No newline at end of file
+            assert mock_handlers.__bool__.call_count > 0, "Logger.handlers wasn't checked"
+    
+    def test_setup_logger_repeated_calls_reuse_configuration(self):
+        """Test setup_logger does not rebuild handlers when called again with the same arguments."""
+        logger = setup_logger("test_logger_repeated", level="DEBUG")
+        handlers = list(logger.handlers)
+        
+        with patch('logging.StreamHandler') as mock_stream_handler:
+            result = setup_logger("test_logger_repeated", level="DEBUG")
+            
+            # Verify the existing logger was returned untouched
+            mock_stream_handler.assert_not_called()
+            assert result is logger
+            assert logger.handlers == handlers
+        
+        # A different configuration is applied normally
+        setup_logger("test_logger_repeated", level="WARNING")
+        assert logger.level == logging.WARNING
+        assert logger.handlers != handlers
+        assert len(logger.handlers) == 1